@@ -1,10 +1,18 @@
 # UserService/db_router.py
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 
 _current_tenant = ContextVar("current_tenant", default=None)
 
-def set_current_tenant(alias: str | None):
-    _current_tenant.set(alias)
+def set_current_tenant(alias: str | None) -> Token | None:
+    # skip the ContextVar write when the tenant is already active
+    if _current_tenant.get() != alias:
+        return _current_tenant.set(alias)
+    return None
+
+def reset_current_tenant(token: Token | None):
+    # undo a set_current_tenant() call; None means nothing was changed
+    if token is not None:
+        _current_tenant.reset(token)
 
 def get_current_tenant() -> str | None:
     return _current_tenant.get()
@@ -1,27 +1,95 @@
-from django.utils.deprecation import MiddlewareMixin
-from FB.db_router import set_current_tenant
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from FB.db_router import set_current_tenant, reset_current_tenant
 from django.conf import settings
 
-class TenantMiddleware(MiddlewareMixin):
+logger = logging.getLogger("FB.middleware")
+
+
+class TenantWarningSampler(logging.Filter):
+    """
+    Let through at most one record per tenant per `interval` seconds so a
+    misbehaving client can't flood the log with unknown-tenant warnings.
+    Only records logged with extra={"tenant": ...} are sampled; everything
+    else on the logger passes through untouched.
+    """
+    max_tracked = 1024
+
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self.interval = interval
+        self._last_seen = {}
+
+    def filter(self, record):
+        if not hasattr(record, "tenant"):
+            return True
+        tenant = record.tenant
+        now = time.monotonic()
+        last = self._last_seen.get(tenant)
+        if last is not None and now - last < self.interval:
+            return False
+        if len(self._last_seen) >= self.max_tracked:
+            self._last_seen.clear()
+        self._last_seen[tenant] = now
+        return True
+
+
+logger.addFilter(TenantWarningSampler())
+
+DEFAULT_TENANT = "vcnew_db"
+
+# Snapshot of known aliases; refreshed on a miss because tenant aliases
+# are registered into settings.DATABASES at runtime.
+_valid_tenants = frozenset(settings.DATABASES)
+
+
+def _is_valid_tenant(tenant: str) -> bool:
+    global _valid_tenants
+    if tenant in _valid_tenants:
+        return True
+    _valid_tenants = frozenset(settings.DATABASES)
+    return tenant in _valid_tenants
+
+
+class TenantMiddleware:
     """
-    Middleware that sets current tenant based on headers
+    Middleware that sets current tenant based on headers.
+    The tenant is reset in a finally block so a raising view can't leak it.
     """
-    def process_request(self, request):
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def _resolve_tenant(self, request) -> str:
         # Get tenant from header (or use vcnew_db as default)
-        tenant = request.headers.get('X-Tenant-ID', 'vcnew_db')
-        
-        # Only set if it's a valid database connection
-        if tenant in settings.DATABASES:
-            set_current_tenant(tenant)
-        else:
-            # Log warning that tenant doesn't exist
-            print(f"Warning: Requested tenant '{tenant}' doesn't exist in DATABASES")
+        tenant = request.META.get("HTTP_X_TENANT_ID", DEFAULT_TENANT)
+
+        # Only use it if it's a valid database connection
+        if not _is_valid_tenant(tenant):
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Requested tenant '%s' doesn't exist in DATABASES", tenant, extra={"tenant": tenant})
             # Use default for tenant apps
-            set_current_tenant('vcnew_db')
-        
-        return None
-    
-    def process_response(self, request, response):
-        # Clear tenant context after request completes
-        set_current_tenant(None)
-        return response
\ No newline at end of file
+            tenant = DEFAULT_TENANT
+        return tenant
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = set_current_tenant(self._resolve_tenant(request))
+        try:
+            return self.get_response(request)
+        finally:
+            reset_current_tenant(token)
+
+    async def __acall__(self, request):
+        token = set_current_tenant(self._resolve_tenant(request))
+        try:
+            return await self.get_response(request)
+        finally:
+            reset_current_tenant(token)
@@ -0,0 +1,141 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Restaurants', '0004_customer_restaurant'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='billing',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='billing_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blocked_day',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='blocked_day_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='category_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cuisine',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='cuisine_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='customer_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ingredient',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='ingredient_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventoryaudit',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='inventoryaudit_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventoryitem',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='inventoryitem_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventorymovement',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='inventorymovement_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventorymovement',
+            index=models.Index(fields=['item', 'is_deleted'], name='invmove_item_deleted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='item_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['restaurant', 'is_deleted'], name='item_resto_deleted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kot',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='kot_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mastercuisine',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='mastercuisine_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='masteritem',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='masteritem_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='order_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['restaurant', 'is_deleted'], name='order_resto_deleted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orderconfigure',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='orderconfigure_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orderitem',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='orderitem_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='qtyingredient',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='qtyingredient_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='restaurant_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurantschedule',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='restaurantschedule_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restocoverimage',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='restocoverimage_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restogalleryimage',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='restogalleryimage_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restomenuimage',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='restomenuimage_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restootherfile',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='restootherfile_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='supplier_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='table',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='table_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablebooking',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='tablebooking_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablebookingfloor',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='tablebookingfloor_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tablebookinglog',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='tablebookinglog_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='warehouse',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_deleted'], name='warehouse_active_idx'),
+        ),
+    ]
@@ -0,0 +1,140 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:12
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def sync_soft_delete_columns(apps, schema_editor):
+    db = schema_editor.connection.alias
+    now = timezone.now()
+    for model in apps.get_app_config("Restaurants").get_models():
+        manager = model._base_manager.using(db)
+        manager.filter(is_deleted=True, deleted_at__isnull=True).update(deleted_at=now)
+        manager.filter(is_deleted=False, deleted_at__isnull=False).update(deleted_at=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Restaurants', '0005_billing_billing_active_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(sync_soft_delete_columns, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='billing',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='billing_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='blocked_day',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='blocked_day_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='category_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='cuisine',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='cuisine_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='customer',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='customer_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='ingredient',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='ingredient_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='inventoryaudit',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='inventoryaudit_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='inventoryitem',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='inventoryitem_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='inventorymovement',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='inventorymovement_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='item',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='item_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='kot',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='kot_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='mastercuisine',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='mastercuisine_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='masteritem',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='masteritem_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='order',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='order_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='orderconfigure',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='orderconfigure_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='orderitem',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='orderitem_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='qtyingredient',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='qtyingredient_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='restaurant',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='restaurant_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='restaurantschedule',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='restaurantschedule_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='restocoverimage',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='restocoverimage_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='restogalleryimage',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='restogalleryimage_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='restomenuimage',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='restomenuimage_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='restootherfile',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='restootherfile_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='supplier',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='supplier_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='table',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='table_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='tablebooking',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='tablebooking_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='tablebookingfloor',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='tablebookingfloor_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='tablebookinglog',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='tablebookinglog_softdel_consistent'),
+        ),
+        migrations.AddConstraint(
+            model_name='warehouse',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('deleted_at__isnull', True), ('is_deleted', False)), models.Q(('deleted_at__isnull', False), ('is_deleted', True)), _connector='OR'), name='warehouse_softdel_consistent'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Restaurants', '0006_billing_billing_softdel_consistent_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inventorymovement',
+            index=models.Index(fields=['item', '-created_at'], name='invmove_item_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['restaurant', 'cuisine'], name='item_resto_cuisine_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['restaurant', 'category'], name='item_resto_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['restaurant', '-order_time'], name='order_resto_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['restaurant', 'Paid'], name='order_resto_paid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='restaurantschedule',
+            index=models.Index(fields=['restaurant', 'operational'], name='schedule_resto_open_idx'),
+        ),
+    ]
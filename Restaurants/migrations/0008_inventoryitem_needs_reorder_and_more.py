@@ -0,0 +1,22 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Restaurants', '0007_inventorymovement_invmove_item_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inventoryitem',
+            name='needs_reorder',
+            field=models.GeneratedField(db_persist=True, expression=models.Q(('current_qty__lte', models.F('reorder_point'))), output_field=models.BooleanField()),
+        ),
+        migrations.AddIndex(
+            model_name='inventoryitem',
+            index=models.Index(condition=models.Q(('needs_reorder', True)), fields=['needs_reorder'], name='inv_need_reorder_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:17
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+import django.db.models.functions.math
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Restaurants', '0008_inventoryitem_needs_reorder_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='price_cents',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast(django.db.models.functions.math.Round(django.db.models.expressions.CombinedExpression(models.F('price'), '*', models.Value(100))), models.BigIntegerField()), output_field=models.BigIntegerField()),
+        ),
+    ]
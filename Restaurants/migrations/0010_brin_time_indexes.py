@@ -0,0 +1,36 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:19
+
+from django.db import migrations
+
+# Order and InventoryMovement are append-only, so rows are physically ordered by
+# time. A BRIN index lets PostgreSQL skip whole block ranges on recent-date
+# filters at a tiny fraction of a B-tree's size (PostgreSQL only).
+BRIN_INDEXES = [
+    ("order_time_brin_idx", "Restaurants_order", "order_time"),
+    ("invmove_created_brin_idx", "Restaurants_inventorymovement", "created_at"),
+]
+
+
+def create_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table, column in BRIN_INDEXES:
+        schema_editor.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING brin ("{column}")')
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in BRIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Restaurants', '0009_orderitem_price_cents'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_indexes, drop_brin_indexes),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Restaurants', '0010_brin_time_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='cuisine',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='item',
+            unique_together=set(),
+        ),
+        migrations.AlterField(
+            model_name='inventoryitem',
+            name='sku',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='mastercuisine',
+            name='name',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AddConstraint(
+            model_name='cuisine',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('restaurant', 'name'), name='cuisine_unique_active'),
+        ),
+        migrations.AddConstraint(
+            model_name='inventoryitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('sku',), name='inventoryitem_sku_uniq_active'),
+        ),
+        migrations.AddConstraint(
+            model_name='item',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('restaurant', 'item_name'), name='item_unique_active'),
+        ),
+        migrations.AddConstraint(
+            model_name='mastercuisine',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('name',), name='mastercuisine_name_uniq_active'),
+        ),
+    ]
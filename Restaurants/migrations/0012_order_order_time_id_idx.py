@@ -0,0 +1,17 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Restaurants', '0011_alter_cuisine_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['-order_time', '-id'], name='order_time_id_idx'),
+        ),
+    ]
@@ -1,9 +1,13 @@
+from decimal import Decimal
+
 from django.db import models
 from django.utils import timezone
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db import transaction
+from django.db import connections, transaction
+from django.db.models import Q, F, Value, Prefetch, Sum, Count, OuterRef, Subquery
+from django.db.models.functions import Greatest, Cast, Round, TruncDate, Coalesce
 
 # ---------------- Base (soft delete + audit) ----------------
 class ActiveManager(models.Manager):
@@ -11,6 +15,61 @@ class ActiveManager(models.Manager):
         return super().get_queryset().filter(is_deleted=False)
 
 
+class RestaurantQuerySet(models.QuerySet):
+    def with_details(self):
+        """
+        Load a restaurant together with its fan-out relations in a fixed number of
+        queries (one per relation) instead of one per restaurant per relation.
+        """
+        return self.select_related("warehouse").prefetch_related(
+            Prefetch("schedules", queryset=RestaurantSchedule.objects.only(
+                "id", "restaurant_id", "day", "operational", "start_time", "end_time",
+            )),
+            Prefetch("cover_images", queryset=RestoCoverImage.objects.filter(is_active=True).only(
+                "id", "image", "restaurant_id",
+            )),
+            "menu_images",
+            "gallery_images",
+            Prefetch("cuisines", queryset=Cuisine.objects.select_related("master_cuisine")),
+            Prefetch("items", queryset=Item.objects.select_related("cuisine", "category").only(
+                "id", "item_name", "price", "restaurant_id", "cuisine_id", "category_id",
+                "cuisine__id", "cuisine__name", "category__id", "category__name",
+            )),
+        )
+
+    def with_list_stats(self):
+        """
+        Annotate total_tables and active_orders_count as correlated subqueries so
+        the list endpoint reads them from the same row instead of two queries per
+        restaurant. Subqueries (not joins) keep the SUM from being multiplied.
+        """
+        tables = (
+            TableBooking.objects.filter(restaurant=OuterRef("pk"))
+            .order_by().values("restaurant")
+            .annotate(total=Sum("no_of_tables")).values("total")
+        )
+        active_orders = (
+            Order.objects.filter(restaurant=OuterRef("pk"), Paid=False)
+            .order_by().values("restaurant")
+            .annotate(count=Count("pk")).values("count")
+        )
+        return self.annotate(
+            total_tables=Coalesce(Subquery(tables), 0),
+            active_orders_count=Coalesce(Subquery(active_orders), 0),
+        )
+
+
+class RestaurantManager(ActiveManager.from_queryset(RestaurantQuerySet)):
+    # long TEXT columns are only needed on detail endpoints; those undefer explicitly
+    def get_queryset(self):
+        return super().get_queryset().defer("terms_and_conditions", "closing_message", "disclaimer")
+
+
+class InventoryItemManager(ActiveManager):
+    def get_queryset(self):
+        return super().get_queryset().defer("description")
+
+
 class DeletedManager(models.Manager):
     def get_queryset(self):
         return super().get_queryset().filter(is_deleted=True)
@@ -38,6 +97,29 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+        indexes = [
+            # partial index backing ActiveManager's is_deleted=False filter
+            models.Index(fields=["is_deleted"], name="%(class)s_active_idx", condition=Q(is_deleted=False)),
+        ]
+        constraints = [
+            # is_deleted is the canonical soft-delete flag; deleted_at must agree with it
+            models.CheckConstraint(
+                condition=Q(is_deleted=False, deleted_at__isnull=True) | Q(is_deleted=True, deleted_at__isnull=False),
+                name="%(class)s_softdel_consistent",
+            ),
+        ]
+
+    def sync_soft_delete(self):
+        # keep deleted_at in step with is_deleted so the check constraint holds;
+        # bulk_create skips save(), so bulk callers invoke this themselves
+        if self.is_deleted and self.deleted_at is None:
+            self.deleted_at = timezone.now()
+        elif not self.is_deleted:
+            self.deleted_at = None
+
+    def save(self, *args, **kwargs):
+        self.sync_soft_delete()
+        return super().save(*args, **kwargs)
 
 
 
@@ -74,23 +156,27 @@ class Restaurant(BaseModel):
     cost_for_two = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     disclaimer = models.TextField(blank=True)
 
+    objects = RestaurantManager()
+
     def __str__(self):
         return self.restaurant_name
 
 # ------------------- restaurant details done -------------------
 class RestaurantSchedule(BaseModel):
-    DAY_CHOICES = [
-        (1, "Monday"),
-        (2, "Tuesday"),
-        (3, "Wednesday"),
-        (4, "Thursday"),
-        (5, "Friday"),
-        (6, "Saturday"),
-        (7, "Sunday"),
-    ]
+    class Day(models.IntegerChoices):
+        MONDAY = 1, "Monday"
+        TUESDAY = 2, "Tuesday"
+        WEDNESDAY = 3, "Wednesday"
+        THURSDAY = 4, "Thursday"
+        FRIDAY = 5, "Friday"
+        SATURDAY = 6, "Saturday"
+        SUNDAY = 7, "Sunday"
+
+    DAY_CHOICES = Day.choices
+    DAY_LABELS = dict(Day.choices)
 
     restaurant = models.ForeignKey(Restaurant, on_delete=models.CASCADE, related_name="schedules")
-    day = models.PositiveSmallIntegerField(choices=DAY_CHOICES)
+    day = models.PositiveSmallIntegerField(choices=Day.choices)
     operational = models.BooleanField(default=False)
 
     start_time = models.TimeField(null=True, blank=True)
@@ -102,31 +188,34 @@ class RestaurantSchedule(BaseModel):
     order_allowed = models.BooleanField(default=False)
     last_order_time = models.TimeField(null=True, blank=True)
 
-    class Meta:
+    class Meta(BaseModel.Meta):
         unique_together = ("restaurant", "day")
         indexes = [
+            *BaseModel.Meta.indexes,
             models.Index(fields=["restaurant", "day"]),
+            models.Index(fields=["restaurant", "operational"], name="schedule_resto_open_idx"),
         ]
 
     def __str__(self):
-        return f"{self.restaurant.name} - {self.get_day_display()}"
+        return f"Schedule(restaurant={self.restaurant_id}, day={self.get_day_display()})"
 
 
 # ------------------- Blocked Days done  -------------------
 
 class Blocked_Day(BaseModel):
-    BLOCK_TYPE_CHOICES = [
-        ('order', 'Order'),
-        ('booking', 'Booking'),
-    ]
+    class BlockType(models.TextChoices):
+        ORDER = 'order', 'Order'
+        BOOKING = 'booking', 'Booking'
+
+    BLOCK_TYPE_CHOICES = BlockType.choices
 
     restaurant = models.ForeignKey("RestaurantSchedule", on_delete=models.CASCADE, related_name="blocked_days")
-    block_type = models.CharField(max_length=10, choices=BLOCK_TYPE_CHOICES) 
+    block_type = models.CharField(max_length=10, choices=BlockType.choices) 
     start_date = models.DateField() # example: 2023-01-01
     end_date = models.DateField()
 
     def __str__(self):
-        return f"{self.restaurant.name} - {self.block_type} Blocked from {self.start_date} to {self.end_date}"
+        return f"BlockedDay(restaurant={self.restaurant_id}, {self.get_block_type_display()} blocked {self.start_date} to {self.end_date})"
 
 # ------------------- table booking - done --------------
 class TableBooking(BaseModel):
@@ -144,14 +233,15 @@ class tablebookingfloor(BaseModel):
     no_of_tables = models.IntegerField(default=0)
 
 class Table(BaseModel):
-    Booking_Status_Choices = [
-        ('available', 'Available'),
-        ('booked', 'Booked'),
-        ('occupied', 'Occupied'),
-    ]
+    class BookingStatus(models.TextChoices):
+        AVAILABLE = 'available', 'Available'
+        BOOKED = 'booked', 'Booked'
+        OCCUPIED = 'occupied', 'Occupied'
+
+    Booking_Status_Choices = BookingStatus.choices
     restaurant = models.ForeignKey(Restaurant, on_delete=models.CASCADE)
     floor = models.ForeignKey(tablebookingfloor, on_delete=models.CASCADE, null=True, blank=True)
-    status = models.CharField(max_length=50,choices=Booking_Status_Choices)
+    status = models.CharField(max_length=50,choices=BookingStatus.choices)
 
 class TableBookingLog(BaseModel):
     restaurant = models.ForeignKey(Restaurant, on_delete=models.CASCADE)
@@ -206,7 +296,14 @@ class RestoOtherFile(BaseModel):
 
 # ------------------- master data done -------------------
 class MasterCuisine(BaseModel):
-    name = models.CharField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
+
+    class Meta(BaseModel.Meta):
+        constraints = [
+            *BaseModel.Meta.constraints,
+            # soft-deleted rows must not block re-creating the same name
+            models.UniqueConstraint(fields=["name"], condition=Q(is_deleted=False), name="mastercuisine_name_uniq_active"),
+        ]
 
     def __str__(self):
         return self.name
@@ -233,11 +330,58 @@ class Cuisine(BaseModel):
         MasterCuisine, on_delete=models.CASCADE, related_name="restaurant_cuisines"
     )
 
-    class Meta:
-        unique_together = ("restaurant","name")
+    class Meta(BaseModel.Meta):
+        constraints = [
+            *BaseModel.Meta.constraints,
+            models.UniqueConstraint(fields=["restaurant", "name"], condition=Q(is_deleted=False), name="cuisine_unique_active"),
+        ]
 
     def __str__(self):
-        return f"{self.name} - {self.restaurant.name}"
+        return f"{self.name} (restaurant {self.restaurant_id})"
+
+    def seed_items(self, using=None):
+        """
+        Create the restaurant's Items for every MasterItem of this cuisine's master
+        cuisine in one INSERT ... SELECT, skipping master items the restaurant
+        already has (same master_item, or same name, which must stay unique).
+
+        :param using: Database alias; defaults to the one the cuisine was saved to.
+        :return: Number of Items created.
+        """
+        db = using or self._state.db or "default"
+        conn = connections[db]
+        qn = conn.ops.quote_name
+        item, master = Item._meta, MasterItem._meta
+
+        def col(opts, name):
+            return qn(opts.get_field(name).column)
+
+        columns = [
+            "created_at", "updated_at", "is_active", "is_deleted", "restaurant", "cuisine",
+            "master_item", "item_name", "master_price", "price", "description", "item_type",
+        ]
+        now = conn.ops.adapt_datetimefield_value(timezone.now())
+        sql = f"""
+            INSERT INTO {qn(item.db_table)} ({", ".join(col(item, c) for c in columns)})
+            SELECT %s, %s, %s, %s, %s, %s, mi.{col(master, "id")}, mi.{col(master, "name")},
+                   0, 0, %s, mi.{col(master, "item_type")}
+            FROM {qn(master.db_table)} mi
+            WHERE mi.{col(master, "master_cuisine")} = %s AND mi.{col(master, "is_deleted")} = %s
+              AND NOT EXISTS (
+                SELECT 1 FROM {qn(item.db_table)} i
+                WHERE i.{col(item, "restaurant")} = %s AND i.{col(item, "is_deleted")} = %s
+                  AND (i.{col(item, "master_item")} = mi.{col(master, "id")}
+                       OR i.{col(item, "item_name")} = mi.{col(master, "name")})
+              )
+        """
+        params = [
+            now, now, True, False, self.restaurant_id, self.pk, "not set",
+            self.master_cuisine_id, False,
+            self.restaurant_id, False,
+        ]
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
 
 
 # ------------------- Category done-------------------
@@ -285,11 +429,20 @@ class Item(BaseModel):
     description = models.TextField(blank=True, null=True)
     item_type = models.CharField(max_length=50, blank=False, null=False) # veg, non-veg, egg
 
-    class Meta:
-        unique_together = ("restaurant", "item_name")
+    class Meta(BaseModel.Meta):
+        constraints = [
+            *BaseModel.Meta.constraints,
+            models.UniqueConstraint(fields=["restaurant", "item_name"], condition=Q(is_deleted=False), name="item_unique_active"),
+        ]
+        indexes = [
+            *BaseModel.Meta.indexes,
+            models.Index(fields=["restaurant", "is_deleted"], name="item_resto_deleted_idx"),
+            models.Index(fields=["restaurant", "cuisine"], name="item_resto_cuisine_idx"),
+            models.Index(fields=["restaurant", "category"], name="item_resto_category_idx"),
+        ]
 
     def __str__(self):
-        return f"{self.item_name} ({self.restaurant.name})"
+        return f"{self.item_name} (restaurant {self.restaurant_id})"
 
 
 # ------------------- ingredients done -------------------
@@ -300,10 +453,15 @@ class Ingredient(BaseModel):
 
 # ------------------- item ingredients done-------------------
 class QtyIngredient(BaseModel):
+    class QtyType(models.TextChoices):
+        GRAMS = 'grams', 'Grams'
+        ML = 'ml', 'Milliliters'
+        PIECES = 'pieces', 'Pieces'
+
     item = models.ForeignKey(Item, on_delete=models.CASCADE)
     ingredient = models.ForeignKey(Ingredient, on_delete=models.CASCADE)
     qty = models.DecimalField(max_digits=10, decimal_places=2)
-    qty_type = models.CharField(max_length=20, choices=[('grams', 'Grams'), ('ml', 'Milliliters'), ('pieces', 'Pieces')])
+    qty_type = models.CharField(max_length=20, choices=QtyType.choices)
 
     def __str__(self):
         return f"{self.qty} {self.qty_type} of {self.ingredient.name} for {self.item.item_name}"
@@ -322,25 +480,26 @@ class Warehouse(BaseModel):
     restaurant = models.OneToOneField("Restaurant", on_delete=models.CASCADE, null=True, blank=True, related_name="warehouse")
 
     def __str__(self):
-        return f"{self.name} ({self.restaurant.name})" if self.restaurant else self.name
+        return f"{self.name} (restaurant {self.restaurant_id})" if self.restaurant_id else self.name
+
 
+class UOM(models.TextChoices):
+    GRAMS = 'grams', 'Grams'
+    KG = 'kg', 'Kilograms'
+    ML = 'ml', 'Milliliters'
+    LTR = 'ltr', 'Liters'
+    PIECES = 'pieces', 'Pieces'
+    UNIT = 'unit', 'Unit'
 
-UOM_CHOICES = [
-    ('grams', 'Grams'),
-    ('kg', 'Kilograms'),
-    ('ml', 'Milliliters'),
-    ('ltr', 'Liters'),
-    ('pieces', 'Pieces'),
-    ('unit', 'Unit'),
-]
+UOM_CHOICES = UOM.choices
 
 
 # ------------------- Inventory Item (SKU) done -------------------
 class InventoryItem(BaseModel):
     name = models.CharField(max_length=255)
-    sku = models.CharField(max_length=100, unique=True) # Stock Keeping Unit shortly barcode
+    sku = models.CharField(max_length=100) # Stock Keeping Unit shortly barcode
     description = models.TextField(blank=True)
-    uom = models.CharField(max_length=20, choices=UOM_CHOICES, default='unit') # unit of measure for stock
+    uom = models.CharField(max_length=20, choices=UOM.choices, default=UOM.UNIT) # unit of measure for stock
     current_qty = models.DecimalField(max_digits=18, decimal_places=4, default=0, validators=[MinValueValidator(0)])
     last_updated = models.DateTimeField(auto_now=True)
 
@@ -365,32 +524,56 @@ class InventoryItem(BaseModel):
     barcode_status = models.BooleanField(default=False)
     #rfid_tag_id = models.CharField(max_length=100, blank=True)
 
-    def __str__(self):
-        return f"{self.sku} - {self.description or 'Item'}"
+    # maintained by the database so reorder listings can hit a partial index
+    needs_reorder = models.GeneratedField(
+        expression=Q(current_qty__lte=F("reorder_point")),
+        output_field=models.BooleanField(),
+        db_persist=True,
+    )
 
-    def needs_reorder(self):
-        return self.current_qty <= self.reorder_point
+    objects = InventoryItemManager()
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            *BaseModel.Meta.indexes,
+            models.Index(fields=["needs_reorder"], condition=Q(needs_reorder=True), name="inv_need_reorder_idx"),
+        ]
+        constraints = [
+            *BaseModel.Meta.constraints,
+            models.UniqueConstraint(fields=["sku"], condition=Q(is_deleted=False), name="inventoryitem_sku_uniq_active"),
+        ]
+
+    def __str__(self):
+        return f"{self.sku} - {self.name or 'Item'}"
 
     def adjust_qty(self, delta):
         """
         Adjust current_qty by delta (positive or negative). Prevent negative unless business allows.
+        Done as a single UPDATE ... SET current_qty = GREATEST(current_qty + delta, 0) so
+        concurrent movements can't overwrite each other with a stale value.
         """
-        self.current_qty = max(self.current_qty + delta, 0)
-        self.save(update_fields=['current_qty', 'last_updated'])
+        db = self._state.db or "default"
+        type(self)._base_manager.using(db).filter(pk=self.pk).update(
+            current_qty=Greatest(F("current_qty") + delta, Value(0)),
+            last_updated=timezone.now(),
+        )
+        # needs_reorder is generated from current_qty, so it changed with it
+        self.refresh_from_db(using=db, fields=['current_qty', 'last_updated', 'needs_reorder'])
 
 
 # ------------------- Inventory Movement / Transfer done-------------------
-MOVEMENT_CHOICES = [
-    ('IN', 'Stock In'),
-    ('OUT', 'Stock Out'),
-    ('TRANSFER', 'Transfer'),
-]
+class Movement(models.TextChoices):
+    IN = 'IN', 'Stock In'
+    OUT = 'OUT', 'Stock Out'
+    TRANSFER = 'TRANSFER', 'Transfer'
+
+MOVEMENT_CHOICES = Movement.choices
 
 class InventoryMovement(BaseModel):
     item = models.ForeignKey(InventoryItem, on_delete=models.CASCADE, related_name='movements')
-    movement_type = models.CharField(max_length=10, choices=MOVEMENT_CHOICES)
+    movement_type = models.CharField(max_length=10, choices=Movement.choices)
     qty = models.DecimalField(max_digits=18, decimal_places=4, validators=[MinValueValidator(0)])
-    uom = models.CharField(max_length=20, choices=UOM_CHOICES, default='unit')
+    uom = models.CharField(max_length=20, choices=UOM.choices, default=UOM.UNIT)
     #from_location = models.ForeignKey(Warehouse, on_delete=models.SET_NULL, null=True, blank=True, related_name='movements_from')
     #to_location = models.ForeignKey(Warehouse, on_delete=models.SET_NULL, null=True, blank=True, related_name='movements_to')
     #transfer_order_number = models.CharField(max_length=100, blank=True)
@@ -401,6 +584,13 @@ class InventoryMovement(BaseModel):
     remarks = models.TextField(blank=True)
     #timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta(BaseModel.Meta):
+        indexes = [
+            *BaseModel.Meta.indexes,
+            models.Index(fields=["item", "is_deleted"], name="invmove_item_deleted_idx"),
+            models.Index(fields=["item", "-created_at"], name="invmove_item_created_idx"),
+        ]
+
     def __str__(self):
         return f"{self.movement_type} {self.qty} {self.uom} - {self.item.sku} @ {self.created_at}"
 
@@ -417,57 +607,64 @@ class InventoryAudit(BaseModel):
     #details = models.TextField(blank=True)
 
 
-# ------------------- Signals: keep InventoryItem.current_qty in sync done-------------------
-@receiver(post_save, sender=InventoryMovement)
-def _apply_movement_to_item(sender, instance: InventoryMovement, created, **kwargs):
-    if not created:
-        return
-    with transaction.atomic():
-        item = instance.item
-        if instance.movement_type == 'IN':
-            item.adjust_qty(instance.qty)
-        elif instance.movement_type == 'OUT':
-            item.adjust_qty(-instance.qty)
-        elif instance.movement_type == 'TRANSFER':
-            # for transfer we do not change global qty; optionally update item.location if to_location provided
-            if instance.to_location:
-                item.location = instance.to_location
-                item.save(update_fields=['location', 'last_updated'])
-
-        # create audit record
-        InventoryAudit.objects.create(
-            action=f"Movement {instance.movement_type}",
-            user_id=None,
-            item=item,
-            qty_before=None,
-            qty_after=item.current_qty,
-            details=f"Movement id={instance.id} qty={instance.qty} uom={instance.uom}"
-        )
-
 # ------------------- orders -------------------
 
 class OrderItem(BaseModel):
     item_name = models.CharField(max_length=100)
     quantity = models.PositiveIntegerField(default=1)
     price = models.DecimalField(max_digits=10, decimal_places=2)
+    # integer minor units kept by the database; totals are summed on this column
+    price_cents = models.GeneratedField(
+        expression=Cast(Round(F("price") * 100), models.BigIntegerField()),
+        output_field=models.BigIntegerField(),
+        db_persist=True,
+    )
 
     def __str__(self):
         return f"{self.item_name} (x{self.quantity}) - {self.price}"  
 
 
+class OrderQuerySet(models.QuerySet):
+    def totals(self):
+        """
+        Sum of line totals (price * quantity) over the selected orders,
+        computed in the database on integer cents.
+        """
+        total_cents = self.aggregate(
+            total=Sum(
+                F("items__price_cents") * F("items__quantity"),
+                # the join bypasses OrderItem's ActiveManager, so skip soft-deleted lines here
+                filter=Q(items__is_deleted=False),
+                output_field=models.BigIntegerField(),
+            )
+        )["total"] or 0
+        return (Decimal(total_cents) / 100).quantize(Decimal("0.01"))
+
+    def daily_totals(self):
+        # one row per day: {"day": date, "total": Decimal}
+        return (
+            self.annotate(day=TruncDate("order_time"))
+            .values("day")
+            .annotate(total=Sum("total_price"))
+            .order_by("day")
+        )
+
+
 class Order(BaseModel):
-    PAYMENT_MODE_CHOICES = [
-        ('cash', 'Cash'),
-        ('Due', 'Due'),
-        ('card', 'Card'),
-        ('Part Payment', 'Part Payment'),
-        ('Other', 'Other')
-    ]
-    ORDER_TYPE_CHOICES = [
-        ('dine_in', 'Dine In'),
-        ('Pick_Up', 'Pick Up'),
-        ('delivery', 'Delivery'),
-    ]
+    class PaymentMode(models.TextChoices):
+        CASH = 'cash', 'Cash'
+        DUE = 'Due', 'Due'
+        CARD = 'card', 'Card'
+        PART_PAYMENT = 'Part Payment', 'Part Payment'
+        OTHER = 'Other', 'Other'
+
+    class OrderType(models.TextChoices):
+        DINE_IN = 'dine_in', 'Dine In'
+        PICK_UP = 'Pick_Up', 'Pick Up'
+        DELIVERY = 'delivery', 'Delivery'
+
+    PAYMENT_MODE_CHOICES = PaymentMode.choices
+    ORDER_TYPE_CHOICES = OrderType.choices
 
     restaurant = models.ForeignKey(Restaurant, on_delete=models.CASCADE)
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE)
@@ -475,14 +672,27 @@ class Order(BaseModel):
     order_time = models.DateTimeField(auto_now_add=True)
     subtotal = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     total_price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
-    payment_mode = models.CharField(max_length=20, choices=PAYMENT_MODE_CHOICES)
-    order_type = models.CharField(max_length=20, choices=ORDER_TYPE_CHOICES)
+    payment_mode = models.CharField(max_length=20, choices=PaymentMode.choices)
+    order_type = models.CharField(max_length=20, choices=OrderType.choices)
     Paid = models.BooleanField(default=False)
     loyalty = models.BooleanField(default=False)
     loyalty_points = models.IntegerField(default=0)
 
+    objects = ActiveManager.from_queryset(OrderQuerySet)()
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            *BaseModel.Meta.indexes,
+            models.Index(fields=["restaurant", "is_deleted"], name="order_resto_deleted_idx"),
+            models.Index(fields=["restaurant", "-order_time"], name="order_resto_time_idx"),
+            models.Index(fields=["-order_time", "-id"], name="order_time_id_idx"),
+            models.Index(fields=["restaurant", "Paid"], name="order_resto_paid_idx"),
+        ]
+
     def calculate_total_price(self):
-        self.total_price = sum(item.price * item.quantity for item in self.items.all())
+        # integer multiply+sum in the database; Decimal only at the boundary
+        db = self._state.db or "default"
+        self.total_price = Order.objects.using(db).filter(pk=self.pk).totals()
         self.save()
 
     def __str__(self):
@@ -497,7 +707,7 @@ class KOT(BaseModel):
     time = models.DateTimeField(auto_now_add=True)
     items = models.ManyToManyField(Order, related_name="Restaurant_kot_items")
     qty = models.IntegerField(default=1)
-    order_type = models.CharField(max_length=20, choices=Order.ORDER_TYPE_CHOICES)
+    order_type = models.CharField(max_length=20, choices=Order.OrderType.choices)
     table_number = models.CharField(max_length=20, null=True, blank=True)
 # -------------------- billing ---------------------
 class Billing(BaseModel):
@@ -509,37 +719,16 @@ class Billing(BaseModel):
     service_charge = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     discount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     total_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
-    order_type = models.CharField(max_length=20, choices=Order.ORDER_TYPE_CHOICES)
-    payment_mode = models.CharField(max_length=20, choices=Order.PAYMENT_MODE_CHOICES)
+    order_type = models.CharField(max_length=20, choices=Order.OrderType.choices)
+    payment_mode = models.CharField(max_length=20, choices=Order.PaymentMode.choices)
     billing_time = models.DateTimeField(auto_now_add=True) 
     
 # ------------------- Signals: create Item for new Cuisine under Restaurant ------------------
 @receiver(post_save, sender=Cuisine)
 def create_items_for_new_cuisine(sender, instance, created, **kwargs):
     if created:
-        restaurant = instance.restaurant
-        master_cuisine = instance.master_cuisine  # ye MasterCuisine object hai
-
-        # is master cuisine ke saare master items lo
-        master_items = MasterItem.objects.filter(master_cuisine=master_cuisine)
-
-        for master_item in master_items:
-            # Agar item pehle se nahi hai to hi create karo
-            exists = Item.objects.filter(
-                restaurant=restaurant,
-                master_item=master_item
-            ).exists()
-            if not exists:
-                Item.objects.create(
-                    restaurant=restaurant,
-                    cuisine=instance,   # ye Restaurant ke Cuisine object hai
-                    master_item=master_item,
-                    item_name=master_item.name,
-                    master_price=0,
-                    price=0,
-                    description="not set",
-                    item_type=master_item.item_type,
-                )
+        # is master cuisine ke saare master items, ek hi INSERT ... SELECT me
+        instance.seed_items(using=kwargs.get("using"))
 
 @receiver(post_save, sender=tablebookingfloor)
 def ensure_tables_for_floor(sender, instance, created, **kwargs):
@@ -1,6 +1,23 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
-    max_page_size = 100
\ No newline at end of file
+    max_page_size = 100
+
+class OrderCursorPagination(CursorPagination):
+    # cursor paging: each page filters past the last order_time seen instead of
+    # counting and skipping OFFSET rows. DRF's cursor only filters on the first
+    # ordering field and steps over equal values with a small offset; the trailing
+    # id just makes the order of those ties stable between pages.
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-order_time", "-id")
+
+    def get_ordering(self, request, queryset, view):
+        # OrderingFilter's ordering replaces ours, so re-append the id tie-breaker
+        ordering = tuple(super().get_ordering(request, queryset, view))
+        if ordering[-1].lstrip("-") != "id":
+            ordering += ("-id" if ordering[0].startswith("-") else "id",)
+        return ordering
\ No newline at end of file
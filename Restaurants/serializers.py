@@ -1,41 +1,357 @@
+import copy
+import operator
+from contextlib import nullcontext
+from functools import cached_property, lru_cache
+
 from rest_framework import serializers
 from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
-from django.db.models import Sum  # Add this import
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.db.models import FileField, Prefetch
+from django.db.models.signals import m2m_changed, post_save, pre_save
 from .models import (
     Restaurant, RestaurantSchedule, Blocked_Day, TableBooking, OrderConfigure, MasterCuisine, MasterItem,
     Cuisine, Category, Item, Customer, RestoCoverImage, RestoMenuImage,
     RestoGalleryImage, RestoOtherFile, Ingredient, QtyIngredient,
-    Supplier, Warehouse, InventoryItem, InventoryMovement, InventoryAudit, OrderItem, Order, tablebookingfloor, Table, TableBookingLog, KOT, Billing
+    Supplier, Warehouse, InventoryItem, InventoryMovement, InventoryAudit, OrderItem, Order, tablebookingfloor, Table, TableBookingLog, KOT, Billing,
+    UOM,
 )
+from .services import record_movement
+from FB.db_router import get_current_tenant
+
+# audit/soft-delete columns every BaseModel serializer exposes
+BASE_MODEL_FIELDS = [
+    'created_at', 'updated_at', 'created_by_id', 'updated_by_id',
+    'is_active', 'is_deleted', 'deleted_at', 'deleted_by_id',
+]
 
 class AliasContextMixin:
-    @property
+    # resolved once per instance; context is fixed once the field is bound
+    @cached_property
     def alias(self) -> str:
-        alias = self.context.get("alias")
+        # explicit context wins; otherwise use the tenant the DB router is serving
+        alias = self.context.get("alias") or get_current_tenant()
         if not alias:
             raise RuntimeError("Serializer context missing 'alias'.")
         return alias
 
-class AliasModelSerializer(AliasContextMixin, serializers.ModelSerializer):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+def _collect_related(serializer_class, model, prefix="", in_many=False):
+    """Walk declared field sources and split relation paths into (select_related, prefetch_related)."""
+    select, prefetch = [], []
+    for name, field in serializer_class._declared_fields.items():
+        source = field.source or name
+        if source == "*":
+            continue
+        parts = source.split(".")
+        path, related, many = [], model, in_many
+        for part in parts:
+            try:
+                f = related._meta.get_field(part)
+            except FieldDoesNotExist:
+                break
+            if not f.is_relation:
+                break
+            path.append(part)
+            many = many or f.many_to_many or f.one_to_many
+            related = f.related_model
+        if not path:
+            continue
+        full = prefix + "__".join(path)
+        (prefetch if many else select).append(full)
+        # nested serializers: their own relations hang off this path
+        nested = getattr(field, "child", field)
+        if isinstance(nested, serializers.BaseSerializer) and len(path) == len(parts):
+            s, p = _collect_related(type(nested), related, full + "__", many)
+            select += s
+            prefetch += p
+    return select, prefetch
+
+class EagerLoadingMixin:
+    """
+    Derive select_related/prefetch_related from the serializer's declared fields
+    (dotted sources and nested serializers), computed once per class, so a view
+    calling Serializer.optimize(qs) picks up new relations automatically.
+    """
+
+    @classmethod
+    def _related_paths(cls):
+        if "_auto_related" not in cls.__dict__:
+            cls._auto_related = _collect_related(cls, cls.Meta.model)
+        return cls._auto_related
+
+    @classmethod
+    def optimize(cls, queryset):
+        select, prefetch = cls._related_paths()
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+def _has_subfields(field):
+    return isinstance(field, serializers.BaseSerializer) or hasattr(field, "child") or hasattr(field, "child_relation")
+
+class CachedFieldsMixin:
+    def get_fields(self):
+        # Model introspection is identical for every instance of a class, so build
+        # the fields once and hand each instance copies of the template. Leaf
+        # fields are only bound (attributes set on the copy), so a shallow copy
+        # is enough; fields that own child fields are deep-copied.
+        cls = type(self)
+        template = cls.__dict__.get("_field_template")
+        if template is None:
+            template = super().get_fields()
+            cls._field_template = template
+        return {
+            name: copy.deepcopy(field) if _has_subfields(field) else copy.copy(field)
+            for name, field in template.items()
+        }
 
-        # Serializer-level unique validators
-        for v in self.validators:
-            if isinstance(v, (UniqueTogetherValidator, UniqueValidator)) and getattr(v, "queryset", None) is not None:
-                v.queryset = v.queryset.using(self.alias)
+class StreamingMixin:
+    STREAM_CHUNK_SIZE = 2000
+
+    @classmethod
+    def stream(cls, queryset, **kwargs):
+        """
+        Yield serialized rows one at a time off queryset.iterator(), so exports
+        never hold the whole result set or the serialized list in memory.
+        """
+        serializer = cls(**kwargs)
+        for obj in queryset.iterator(chunk_size=cls.STREAM_CHUNK_SIZE):
+            yield serializer.to_representation(obj)
+
+class RepresentationCacheMixin:
+    """
+    Memoize to_representation for read-mostly catalog rows, keyed on
+    (alias, pk, updated_at). Every save() bumps updated_at, so an edited row
+    misses and is rendered afresh; the superseded entry is dropped when the
+    per-class cache is reset at REPRESENTATION_CACHE_SIZE entries.
+    """
+    REPRESENTATION_CACHE_SIZE = 4096
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._representation_cache = {}
+
+    def to_representation(self, instance):
+        if instance.pk is None:
+            return super().to_representation(instance)
+        cache = type(self)._representation_cache
+        key = (self.alias, instance.pk, instance.updated_at)
+        data = cache.get(key)
+        if data is None:
+            data = super().to_representation(instance)
+            if len(cache) >= self.REPRESENTATION_CACHE_SIZE:
+                cache.clear()
+            cache[key] = data
+        # callers may mutate the response body
+        return dict(data)
+
+class AliasPrimaryKeyRelatedField(AliasContextMixin, serializers.PrimaryKeyRelatedField):
+    """PK field that resolves against the tenant alias from context, only when validating input."""
+
+    def __init__(self, model=None, **kwargs):
+        # ModelSerializer builds implicit FK fields with queryset= only
+        if model is None and kwargs.get("queryset") is not None:
+            model = kwargs["queryset"].model
+        self.model = model
+        if model is not None and not kwargs.get("read_only"):
+            kwargs.setdefault("queryset", model._default_manager.none())
+        super().__init__(**kwargs)
+
+    def get_queryset(self):
+        return AliasModelSerializer._aliased_qs(self.model, self.alias).all()
+
+def _has_save_signals(model):
+    # bulk_create skips save() and its signals; models with receivers must not use it
+    return pre_save.has_listeners(model) or post_save.has_listeners(model)
+
+def _link_new_m2m(obj, name, values, using):
+    # obj was just inserted, so there are no existing links for set()/add() to diff against
+    field = obj._meta.get_field(name)
+    through = field.remote_field.through
+    if m2m_changed.has_listeners(through):
+        getattr(obj, name).add(*values)
+        return
+    src = through._meta.get_field(field.m2m_field_name()).attname
+    dst = through._meta.get_field(field.m2m_reverse_field_name()).attname
+    through._base_manager.db_manager(using).bulk_create(
+        [through(**{src: obj.pk, dst: getattr(v, "pk", v)}) for v in dict.fromkeys(values)],
+        ignore_conflicts=True,
+    )
 
-        for field in self.fields.values():
-            for val in getattr(field, "validators", []):
+class AliasListSerializer(serializers.ListSerializer):
+    BULK_BATCH_SIZE = 500
+
+    def create(self, validated_data):
+        child = self.child
+        model = child.Meta.model
+        # Serializers with their own create(), m2m input or save signals need per-row saves
+        if (
+            type(child).create is not AliasModelSerializer.create
+            or _has_save_signals(model)
+            or any(f.name in d for f in model._meta.many_to_many for d in validated_data)
+        ):
+            # one commit for the whole list rather than one per row
+            with transaction.atomic(using=child.alias):
+                return super().create(validated_data)
+
+        objs = [model(**d) for d in validated_data]
+        for obj in objs:
+            obj.sync_soft_delete()
+        return model._base_manager.db_manager(child.alias).bulk_create(objs, batch_size=self.BULK_BATCH_SIZE)
+
+class AliasModelSerializer(EagerLoadingMixin, AliasContextMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    serializer_related_field = AliasPrimaryKeyRelatedField
+    # opt-in: single creates INSERT through bulk_create, skipping save() and the
+    # update-vs-insert check; ignored for models that have save signal receivers
+    BULK_SAFE = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Each subclass declares its own Meta, so default the list class here
+        meta = getattr(cls, "Meta", None)
+        if meta is not None and not hasattr(meta, "list_serializer_class"):
+            meta.list_serializer_class = AliasListSerializer
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _aliased_qs(model, alias, condition=None, all_rows=False):
+        # Shared per (model, alias): querysets are lazy and every consumer
+        # (related fields, unique validators) clones before evaluating.
+        # all_rows uses the plain base manager, so soft-deleted rows are included.
+        manager = model._base_manager if all_rows else model._default_manager
+        qs = manager.db_manager(alias).get_queryset()
+        if condition is not None:
+            qs = qs.filter(condition)
+        return qs
+
+    def get_fields(self):
+        fields = super().get_fields()
+        cls = type(self)
+        names = cls.__dict__.get("_unique_field_names")
+        if names is None:
+            # the only fields whose validators need per-tenant rebinding
+            names = cls._unique_field_names = tuple(
+                name for name, field in cls._field_template.items()
+                if any(isinstance(v, UniqueValidator) for v in getattr(field, "validators", ()))
+            )
+        for name in names:
+            # copies share validator objects; each instance gets its own unique
+            # validators, rebound to the tenant (soft-deleted rows included, as the
+            # database constraint covers them)
+            validators = [copy.copy(v) for v in fields[name].validators]
+            for val in validators:
                 if isinstance(val, UniqueValidator) and getattr(val, "queryset", None) is not None:
-                    val.queryset = val.queryset.using(self.alias)
+                    val.queryset = self._aliased_qs(val.queryset.model, self.alias, all_rows=True)
+            fields[name].validators = validators
+        return fields
+
+    def get_validators(self):
+        # DRF builds these lazily on first use, so read-only (output) instances
+        # never pay for the rebinding below
+        validators = super().get_validators()
+        for v in validators:
+            if isinstance(v, (UniqueTogetherValidator, UniqueValidator)) and getattr(v, "queryset", None) is not None:
+                # Unique checks must see every row the database constraint covers,
+                # soft-deleted ones included; partial constraints narrow it via condition.
+                # DRF evaluates partial-constraint conditions on the default DB;
+                # apply the condition to the tenant queryset instead
+                condition = getattr(v, "condition", None)
+                v.queryset = self._aliased_qs(v.queryset.model, self.alias, condition, all_rows=True)
+                if condition is not None:
+                    v.condition = None
+        return validators
+
+    def values_rows(self, queryset):
+        """
+        Render queryset as to_representation would, from a values() projection
+        instead of model instances. Only for flat serializers: every readable
+        field must be a model column (relations render as their pk).
+        """
+        return self.rows_from_values(self.values_queryset(queryset))
+
+    def values_queryset(self, queryset):
+        # split from values_rows so a view can paginate the projection first
+        return queryset.values(*(field.source for field in self._readable_fields))
+
+    def rows_from_values(self, rows):
+        fields = list(self._readable_fields)
+        opts = self.Meta.model._meta
+        # file columns come back as names; wrap them so the field can build the URL
+        file_fields = {
+            f.name: f for f in opts.concrete_fields if isinstance(f, FileField)
+        }
+        data = []
+        for row in rows:
+            out = {}
+            for field in fields:
+                value = row[field.source]
+                if field.source in file_fields:
+                    model_field = file_fields[field.source]
+                    value = model_field.attr_class(None, model_field, value)
+                if value is None or isinstance(field, serializers.RelatedField):
+                    out[field.field_name] = value
+                else:
+                    out[field.field_name] = field.to_representation(value)
+            data.append(out)
+        return data
+
+    def create(self, validated_data):
+        model = self.Meta.model
+        many_to_many = {
+            f.name: validated_data.pop(f.name)
+            for f in model._meta.many_to_many
+            if f.name in validated_data
+        }
+        # validated_data already passed the DRF field validators built from the
+        # model, and no model defines clean(), so full_clean() would only repeat them
+        obj = model(**validated_data)
+        # the row and its m2m links commit together; a lone INSERT needs no transaction
+        with transaction.atomic(using=self.alias) if many_to_many else nullcontext():
+            if self.BULK_SAFE and not _has_save_signals(model):
+                obj.sync_soft_delete()
+                model._base_manager.db_manager(self.alias).bulk_create([obj])
+            else:
+                obj.save(using=self.alias)
+            for name, value in many_to_many.items():
+                _link_new_m2m(obj, name, value, self.alias)
+        return obj
+
+    def update(self, instance, validated_data):
+        opts = instance._meta
+        m2m_names = {f.name for f in opts.many_to_many}
+        many_to_many = {}
+        update_fields = set()
+        for attr, value in validated_data.items():
+            if attr in m2m_names:
+                many_to_many[attr] = value
+            else:
+                setattr(instance, attr, value)
+                update_fields.add(attr)
+        # write only the submitted columns plus the ones save() maintains itself, so a
+        # PATCH neither rewrites untouched columns nor clobbers concurrent UPDATEs
+        # (e.g. InventoryItem.adjust_qty) with the values loaded before it
+        update_fields.update(f.name for f in opts.concrete_fields if getattr(f, "auto_now", False))
+        if update_fields & {"is_deleted", "deleted_at"}:
+            update_fields.update(("is_deleted", "deleted_at"))
+        with transaction.atomic(using=self.alias) if many_to_many else nullcontext():
+            instance.save(using=self.alias, update_fields=update_fields)
+            for name, value in many_to_many.items():
+                getattr(instance, name).set(value)
+        # the database recomputes GeneratedFields (e.g. needs_reorder) on UPDATE but
+        # Django only reads them back on INSERT
+        generated = [f.attname for f in opts.concrete_fields if f.generated]
+        if generated:
+            instance.refresh_from_db(using=self.alias, fields=generated)
+        return instance
 
 # ================= Core Restaurant Serializers =================
 
 class SimpleCuisineSerializer(AliasModelSerializer):
     class Meta:
         model = Cuisine
-        fields = "__all__"
+        fields = ["id", "name", "restaurant", "master_cuisine", *BASE_MODEL_FIELDS]
 
 class RestaurantSerializer(AliasModelSerializer):
     class Meta:
@@ -69,26 +385,23 @@ class RestaurantSerializer(AliasModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'created_by_id', 'updated_by_id']
 
-    def create(self, validated_data):
-        restaurant = Restaurant.objects.create(**validated_data)
-        return restaurant
-
-    def update(self, instance, validated_data):
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
-        return instance
-
 
 class RestaurantScheduleSerializer(AliasModelSerializer):
-    day_display = serializers.CharField(source="get_day_display", read_only=True)
+    day_display = serializers.SerializerMethodField()
 
     class Meta:
         model = RestaurantSchedule
-        fields = "__all__"
+        fields = [
+            "id", "day_display", "day", "operational", "start_time", "end_time",
+            "break_start_time", "break_end_time", "booking_allowed", "order_allowed",
+            "last_order_time", "restaurant", *BASE_MODEL_FIELDS
+        ]
+
+    def get_day_display(self, obj):
+        # get_day_display() rebuilds the choices dict on every call
+        return RestaurantSchedule.DAY_LABELS.get(obj.day, obj.day)
 
 class RestaurantScheduleBulkSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none())
     days = serializers.ListField(
         child=serializers.IntegerField(min_value=1, max_value=7),
         write_only=True
@@ -103,416 +416,276 @@ class RestaurantScheduleBulkSerializer(AliasModelSerializer):
             "booking_allowed", "order_allowed", "last_order_time"
         ]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-
     def create(self, validated_data):
         restaurant = validated_data.pop("restaurant")
         days = validated_data.pop("days")
 
-        objs = []
-        for day in days:
-            obj, _ = RestaurantSchedule.objects.using(self.alias).update_or_create(
-                restaurant=restaurant,
-                day=day,
-                defaults=validated_data
-            )
-            objs.append(obj)
-        return objs
+        # one INSERT ... ON CONFLICT (restaurant, day) DO UPDATE for all days instead
+        # of a SELECT + UPDATE/INSERT per day; a soft-deleted day row is revived
+        objs = [
+            RestaurantSchedule(restaurant=restaurant, day=day, **validated_data)
+            for day in dict.fromkeys(days)
+        ]
+        return RestaurantSchedule._base_manager.db_manager(self.alias).bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=["restaurant", "day"],
+            update_fields=[*validated_data, "is_deleted", "deleted_at", "updated_at"],
+        )
 
 
 class BlockedDaySerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=RestaurantSchedule.objects.none())
-
     class Meta:
         model = Blocked_Day
-        fields = '__all__'  # Use __all__ to include all actual model fields
+        fields = [
+            'id', 'restaurant', 'block_type', 'start_date', 'end_date',
+            *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ['id']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = RestaurantSchedule.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = Blocked_Day(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class TableBookingSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none())
-
     class Meta:
         model = TableBooking
-        fields = '__all__'  # Use __all__ to include all actual model fields
+        fields = [
+            'id', 'restaurant', 'no_of_tables', 'min_people', 'max_people',
+            'can_cancel_before', 'booking_not_available_text', 'no_of_floors',
+            *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ['id']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = TableBooking(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class OrderConfigureSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none())
-
     class Meta:
         model = OrderConfigure
-        fields = '__all__'
+        fields = [
+            'id', 'restaurant', 'GST_percentage', 'delivery_charge', 'service_charge',
+            'minimum_order', 'order_not_available_text', *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ['id']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = OrderConfigure(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 # ================= Menu Management Serializers =================
 
-class MasterCuisineSerializer(AliasModelSerializer):
+class MasterCuisineSerializer(RepresentationCacheMixin, AliasModelSerializer):
     class Meta:
         model = MasterCuisine
-        fields = "__all__"
+        fields = ["id", "name", *BASE_MODEL_FIELDS]
         read_only_fields = ["id"]
 
 
-class MasterItemSerializer(AliasModelSerializer):
+class MasterItemSerializer(RepresentationCacheMixin, AliasModelSerializer):
     class Meta:
         model = MasterItem
-        fields = "__all__"
+        fields = ["id", "name", "item_type", "master_cuisine", *BASE_MODEL_FIELDS]
         read_only_fields = ["id"]
 
 
-class CuisineSerializer(AliasModelSerializer):
+class CuisineSerializer(RepresentationCacheMixin, AliasModelSerializer):
     class Meta:
         model = Cuisine
-        fields = "__all__"
+        fields = ["id", "name", "restaurant", "master_cuisine", *BASE_MODEL_FIELDS]
         read_only_fields = ["id"]
 
-    def create(self, validated_data):
-        cuisine = Cuisine.objects.using(self.alias).create(**validated_data)
-
-        # Auto-create Items from MasterItems
-        master_items = MasterItem.objects.using(self.alias).filter(master_cuisine=cuisine.master_cuisine)
-        items_to_create = []
-        for mi in master_items:
-            items_to_create.append(
-                Item(
-                    restaurant=cuisine.restaurant,
-                    cuisine=cuisine,
-                    master_item=mi,
-                    item_name=mi.name,
-                    master_price=0,  # optional, can map if you have pricing
-                    price=0,         # default until restaurant sets price
-                    item_type=mi.item_type,
-                )
-            )
-
-        Item.objects.using(self.alias).bulk_create(items_to_create)
-
-        return cuisine
-
 class CategorySerializer(AliasModelSerializer):
     class Meta:
         model = Category
-        fields = "__all__"
+        fields = [
+            "id", "name", "timing", "restaurant", "parent", "cuisines",
+            *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ["id"]
 
 
 class ItemSerializer(AliasModelSerializer):
     class Meta:
         model = Item
-        fields = "__all__"
+        fields = [
+            "id", "item_image", "item_name", "master_price", "price", "description",
+            "item_type", "restaurant", "cuisine", "master_item", "category",
+            *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ["id"]
 
-    def update(self, instance, validated_data):
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.full_clean(validate_unique=False)
-        instance.save(using=self.alias)
-        return instance
-
 
 
 
 # ================= Customer Serializers =================
 
 class CustomerSerializer(AliasModelSerializer):
+    BULK_SAFE = True
+
     class Meta:
         model = Customer
-        fields = '__all__'
+        fields = [
+            'id', 'customer_name', 'number', 'address', 'locality', 'loyalty_points',
+            'restaurant', *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ['id']
 
-    def create(self, validated_data):
-        obj = Customer(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 # ================= Attachment Serializers =================
 
 class RestoCoverImageSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none())
+    BULK_SAFE = True
 
     class Meta:
         model = RestoCoverImage
         fields = ['id', 'restaurant', 'image', 'is_active', 'created_at']
         read_only_fields = ['id', 'created_at']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = RestoCoverImage(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class RestoMenuImageSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none())
+    BULK_SAFE = True
 
     class Meta:
         model = RestoMenuImage
         fields = ['id', 'restaurant', 'image', 'created_at']
         read_only_fields = ['id', 'created_at']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = RestoMenuImage(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class RestoGalleryImageSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none())
+    BULK_SAFE = True
 
     class Meta:
         model = RestoGalleryImage
         fields = ['id', 'restaurant', 'image', 'created_at']
         read_only_fields = ['id', 'created_at']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = RestoGalleryImage(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class RestoOtherFileSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none())
+    BULK_SAFE = True
 
     class Meta:
         model = RestoOtherFile
         fields = ['id', 'restaurant', 'file', 'created_at']
         read_only_fields = ['id', 'created_at']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = RestoOtherFile(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 # ================= Ingredient Management Serializers =================
 
 class IngredientSerializer(AliasModelSerializer):
+    BULK_SAFE = True
+
     class Meta:
         model = Ingredient
-        fields = '__all__'
+        fields = ['id', 'name', *BASE_MODEL_FIELDS]
         read_only_fields = ['id']
 
-    def create(self, validated_data):
-        obj = Ingredient(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class QtyIngredientSerializer(AliasModelSerializer):
-    item = serializers.PrimaryKeyRelatedField(queryset=Item.objects.none())
-    ingredient = serializers.PrimaryKeyRelatedField(queryset=Ingredient.objects.none())
+    BULK_SAFE = True
 
     class Meta:
         model = QtyIngredient
-        fields = '__all__'
+        fields = ['id', 'item', 'ingredient', 'qty', 'qty_type', *BASE_MODEL_FIELDS]
         read_only_fields = ['id']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["item"].queryset = Item.objects.using(self.alias).all()
-        self.fields["ingredient"].queryset = Ingredient.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = QtyIngredient(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 # ================= Inventory Management Serializers =================
 
 class SupplierSerializer(AliasModelSerializer):
+    BULK_SAFE = True
+
     class Meta:
         model = Supplier
-        fields = '__all__'
+        fields = ['id', 'name', 'contact_info', *BASE_MODEL_FIELDS]
         read_only_fields = ['id']
 
-    def create(self, validated_data):
-        obj = Supplier(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class WarehouseSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none(), required=False, allow_null=True)
-
     class Meta:
         model = Warehouse
-        fields = '__all__'
+        fields = ['id', 'restaurant', 'name', *BASE_MODEL_FIELDS]
         read_only_fields = ['id']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = Warehouse(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class InventoryItemSerializer(AliasModelSerializer):
-    preferred_supplier = serializers.PrimaryKeyRelatedField(queryset=Supplier.objects.none(), required=False, allow_null=True)
-    category = serializers.PrimaryKeyRelatedField(queryset=Category.objects.none(), required=False, allow_null=True)
+    BULK_SAFE = True
 
     class Meta:
         model = InventoryItem
-        fields = '__all__'
+        fields = [
+            'id', 'preferred_supplier', 'name', 'sku', 'description', 'uom',
+            'current_qty', 'last_updated', 'reorder_point', 'safety_stock', 'eoq',
+            'bin_location', 'expiry_date', 'valuation', 'stock_turnover_rate',
+            'forecast', 'barcode_status', 'needs_reorder', *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ['id', 'last_updated']
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["preferred_supplier"].queryset = Supplier.objects.using(self.alias).all()
-        self.fields["category"].queryset = Category.objects.using(self.alias).all()
-
-    def create(self, validated_data):
-        obj = InventoryItem(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 class InventoryMovementSerializer(AliasModelSerializer):
-    item = serializers.PrimaryKeyRelatedField(queryset=InventoryItem.objects.none())
-    from_location = serializers.PrimaryKeyRelatedField(queryset=Warehouse.objects.none(), required=False, allow_null=True)
-    to_location = serializers.PrimaryKeyRelatedField(queryset=Warehouse.objects.none(), required=False, allow_null=True)
-
     class Meta:
         model = InventoryMovement
-        fields = '__all__'
-        read_only_fields = ['id', 'timestamp']
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["item"].queryset = InventoryItem.objects.using(self.alias).all()
-        self.fields["from_location"].queryset = Warehouse.objects.using(self.alias).all()
-        self.fields["to_location"].queryset = Warehouse.objects.using(self.alias).all()
+        fields = [
+            'id', 'item', 'movement_type', 'qty', 'uom', 'remarks', *BASE_MODEL_FIELDS
+        ]
+        read_only_fields = ['id', 'created_at']
 
     def create(self, validated_data):
-        obj = InventoryMovement(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
+        return record_movement(
+            item=validated_data["item"],
+            qty=validated_data["qty"],
+            movement_type=validated_data["movement_type"],
+            uom=validated_data.get("uom", UOM.UNIT),
+            remarks=validated_data.get("remarks", ""),
+            created_by_id=validated_data.get("created_by_id"),
+            using=self.alias,
+        )
 
 # ================= Order Management Serializers =================
 class OrderItemSerializer(AliasModelSerializer):
+    BULK_SAFE = True
+
     class Meta:
         model = OrderItem
         fields = ["id", "item_name", "quantity", "price"]
         read_only_fields = ["id"]
 
-    def create(self, validated_data):
-        # Ensure OrderItem is saved in the correct tenant DB
-        obj = OrderItem(**validated_data)
-        obj.full_clean(validate_unique=False)
-        obj.save(using=self.alias)
-        return obj
-
 
 class OrderSerializer(AliasModelSerializer):
-    restaurant = serializers.PrimaryKeyRelatedField(queryset=Restaurant.objects.none())
-    customer = serializers.PrimaryKeyRelatedField(queryset=Customer.objects.none())
     items = OrderItemSerializer(many=True)
 
     class Meta:
         model = Order
-        fields = "__all__"
+        fields = [
+            "id", "restaurant", "customer", "items", "order_time", "subtotal",
+            "total_price", "payment_mode", "order_type", "Paid", "loyalty",
+            "loyalty_points", *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ["id", "order_time", "total_price"]
         extra_kwargs = {
             # allow client to send subtotal but we'll recompute server-side
             "subtotal": {"required": False}
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.fields["restaurant"].queryset = Restaurant.objects.using(self.alias).all()
-        self.fields["customer"].queryset = Customer.objects.using(self.alias).all()
-
     def create(self, validated_data):
         items_data = validated_data.pop("items", [])
 
-        # Create order in tenant DB
-        order = Order(**validated_data)
-        order.full_clean(validate_unique=False)
-        order.save(using=self.alias)
-
-        # Create OrderItem rows and attach
-        created_items = []
-        subtotal = 0
-        for item in items_data:
-            oi = OrderItem(
+        # OrderItem rows and totals are built up front, so the order is inserted once
+        # and its lines in a single multi-row INSERT
+        created_items = [
+            OrderItem(
                 item_name=item.get("item_name"),
                 quantity=item.get("quantity", 1),
                 price=item.get("price", 0),
             )
-            oi.full_clean(validate_unique=False)
-            oi.save(using=self.alias)
-            created_items.append(oi)
-            subtotal += (oi.price or 0) * (oi.quantity or 0)
+            for item in items_data
+        ]
+        subtotal = sum((oi.price or 0) * (oi.quantity or 0) for oi in created_items)
 
-        if created_items:
-            order.items.add(*created_items)
+        # order, its lines and the totals commit together
+        with transaction.atomic(using=self.alias):
+            # Create order in tenant DB
+            order = Order(**validated_data)
+            order.subtotal = subtotal
+            order.total_price = subtotal  # extend with taxes/charges if needed
+            order.save(using=self.alias)
 
-        # Compute totals
-        order.subtotal = subtotal
-        order.total_price = subtotal  # extend with taxes/charges if needed
-        order.save(using=self.alias)
+            if created_items:
+                OrderItem._base_manager.db_manager(self.alias).bulk_create(created_items)
+                _link_new_m2m(order, "items", created_items, self.alias)
 
         return order
 
 
 # ================= List Serializers (for detailed views) =================
 
-class RestaurantListSerializer(serializers.ModelSerializer):
-    """List view with related data for restaurants"""
-    total_tables = serializers.SerializerMethodField()
-    active_orders_count = serializers.SerializerMethodField()
+class RestaurantListSerializer(StreamingMixin, EagerLoadingMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    """List view with related data for restaurants.
+
+    total_tables / active_orders_count come from Restaurant.objects.with_list_stats();
+    querysets without the annotation render 0.
+    """
+    total_tables = serializers.IntegerField(read_only=True, default=0)
+    active_orders_count = serializers.IntegerField(read_only=True, default=0)
 
     class Meta:
         model = Restaurant
@@ -524,21 +697,44 @@ class RestaurantListSerializer(serializers.ModelSerializer):
             'total_tables', 'active_orders_count'
         ]
 
-    def get_total_tables(self, obj):
-        try:
-            return obj.tablebooking_set.aggregate(
-                total=Sum('no_of_tables')
-            )['total'] or 0
-        except:
-            return 0
-
-    def get_active_orders_count(self, obj):
-        try:
-            return obj.order_set.filter(Paid=False).count()
-        except:
-            return 0
-
-class ItemListSerializer(serializers.ModelSerializer):
+    @classmethod
+    def setup_eager_loading(cls, queryset, with_rows=False):
+        """
+        Apply the list annotations. with_rows additionally prefetches the rows
+        behind them (obj.table_bookings, obj.active_orders) in one narrow query
+        each, for callers that need more than the counts.
+        """
+        queryset = queryset.with_list_stats()
+        if with_rows:
+            db = queryset.db
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'tablebooking_set',
+                    queryset=TableBooking.objects.using(db).only('id', 'restaurant_id', 'no_of_tables'),
+                    to_attr='table_bookings',
+                ),
+                Prefetch(
+                    'order_set',
+                    queryset=Order.objects.using(db).filter(Paid=False).only('id', 'restaurant_id'),
+                    to_attr='active_orders',
+                ),
+            )
+        return queryset
+
+    @classmethod
+    def values_queryset(cls, queryset):
+        # output keys are the column / annotation names, so no renaming is needed
+        return queryset.values(*cls.Meta.fields)
+
+    @classmethod
+    def rows_from_values(cls, rows):
+        """Materialize values() rows; cost_for_two is a string as DecimalField renders it."""
+        data = list(rows)
+        for row in data:
+            row['cost_for_two'] = str(row['cost_for_two'])
+        return data
+
+class ItemListSerializer(StreamingMixin, EagerLoadingMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """List view with cuisine and category names"""
     cuisine_name = serializers.CharField(source='cuisine.name', read_only=True)
     category_name = serializers.CharField(source='category.name', read_only=True)
@@ -551,6 +747,29 @@ class ItemListSerializer(serializers.ModelSerializer):
             'cuisine_name', 'category_name', 'restaurant_name'
         ]
 
+    # C-level attribute chain in Meta.fields order; category is resolved by hand
+    # because it is nullable and attrgetter would raise on None.name
+    _GETTER = operator.attrgetter(
+        'id', 'item_name', 'description', 'price', 'item_type',
+        'cuisine.name', 'category', 'restaurant.restaurant_name',
+    )
+    _KEYS = tuple(Meta.fields)
+
+    def to_representation(self, instance):
+        row = dict(zip(self._KEYS, self._GETTER(instance)))
+        category = row['category_name']
+        row['category_name'] = category.name if category is not None else None
+        row['price'] = self.fields['price'].to_representation(row['price'])
+        return row
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the FKs rendered above and load only the columns used."""
+        return cls.optimize(queryset).only(
+            'id', 'item_name', 'description', 'price', 'item_type',
+            'cuisine__name', 'category__name', 'restaurant__restaurant_name',
+        )
+
 # ----------------------------------------------
 class ItemNestedSerializer(AliasModelSerializer):
     class Meta:
@@ -578,35 +797,51 @@ class CuisineNestedSerializer(AliasModelSerializer):
 class TableBookingFloorSerializer(AliasModelSerializer):
     class Meta:
         model = tablebookingfloor
-        fields = "__all__"
+        fields = ["id", "floor_name", "no_of_tables", "restaurant", *BASE_MODEL_FIELDS]
         read_only_fields = ["id"]
 
 
 class TableSerializer(AliasModelSerializer):
     class Meta:
         model = Table
-        fields = "__all__"
+        fields = ["id", "status", "restaurant", "floor", *BASE_MODEL_FIELDS]
         read_only_fields = ["id"]
 
 
 class TableBookingLogSerializer(AliasModelSerializer):
+    BULK_SAFE = True
+
     class Meta:
         model = TableBookingLog
-        fields = "__all__"
+        fields = [
+            "id", "no_of_people", "start_time", "end_time", "restaurant", "table",
+            "customer", *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ["id"]
 
 
 # ============= KOT & Billing Serializers =============
 
 class KOTSerializer(AliasModelSerializer):
+    BULK_SAFE = True
+
     class Meta:
         model = KOT
-        fields = "__all__"
+        fields = [
+            "id", "kot_number", "time", "qty", "order_type", "table_number",
+            "restaurant", "order", "customer", "items", *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ["id", "time"]
 
 
 class BillingSerializer(AliasModelSerializer):
+    BULK_SAFE = True
+
     class Meta:
         model = Billing
-        fields = "__all__"
+        fields = [
+            "id", "subtotal_amount", "tax", "service_charge", "discount",
+            "total_amount", "order_type", "payment_mode", "billing_time", "restaurant",
+            "customer", "order", *BASE_MODEL_FIELDS
+        ]
         read_only_fields = ["id", "billing_time"]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+# Restaurants/services.py
+
+from decimal import Decimal
+from typing import Optional
+
+from django.db import transaction
+
+from .models import InventoryAudit, InventoryItem, InventoryMovement, Movement, UOM
+
+AUDIT_BATCH_SIZE = 500
+
+
+def _queue_audit(db: str, audit: InventoryAudit) -> None:
+    """
+    Buffer an unsaved InventoryAudit until the surrounding transaction on `db`
+    commits, then write the whole batch with a single bulk_create.
+    Outside a transaction the audit is written immediately.
+
+    Batches live on the connection, one per savepoint stack, and each registers
+    its own on_commit flush from that level. Rolling back a savepoint (or the
+    whole transaction) drops the flush, and with it the audits queued there; a
+    batch whose flush is no longer pending is never appended to again.
+
+    :param db: Database alias the audit belongs to.
+    :param audit: Unsaved InventoryAudit instance.
+    """
+    conn = transaction.get_connection(db)
+    if not conn.in_atomic_block:
+        InventoryAudit.objects.using(db).bulk_create([audit])
+        return
+
+    level = frozenset(conn.savepoint_ids)
+    batches = conn.__dict__.setdefault("_audit_batches", {})
+    entry = batches.get(level)
+    if entry is None or not any(func is entry[0] for _, func, _ in conn.run_on_commit):
+        # forget batches whose flush was discarded by a rollback
+        live = {func for _, func, _ in conn.run_on_commit}
+        for key in [k for k, (flush, _) in batches.items() if flush not in live]:
+            del batches[key]
+
+        pending = []
+
+        def _flush():
+            if batches.get(level, (None,))[0] is _flush:
+                del batches[level]
+            InventoryAudit.objects.using(db).bulk_create(pending, batch_size=AUDIT_BATCH_SIZE)
+
+        transaction.on_commit(_flush, using=db)
+        batches[level] = entry = (_flush, pending)
+    entry[1].append(audit)
+
+
+def record_movement(
+    *,
+    item: InventoryItem,
+    qty: Decimal,
+    movement_type: str,
+    uom: str = UOM.UNIT,
+    remarks: str = "",
+    created_by_id: Optional[int] = None,
+    using: str = "default",
+) -> InventoryMovement:
+    """
+    Record a stock movement and apply it to the item's quantity.
+
+    This is the only supported way to create an InventoryMovement: the row is
+    inserted, the item row is locked, current_qty is adjusted with a single atomic
+    UPDATE and the audit record is queued for the transaction's batched insert.
+
+    :param item: The InventoryItem being moved (already loaded by the caller).
+    :param qty: Non-negative quantity moved.
+    :param movement_type: One of Movement (IN, OUT, TRANSFER).
+    :param uom: Unit of measure of qty.
+    :param remarks: Free-text remarks stored on the movement.
+    :param created_by_id: Id of the acting user, if known.
+    :param using: Tenant database alias.
+    :return: The saved InventoryMovement.
+    """
+    movement = InventoryMovement(
+        item=item,
+        movement_type=movement_type,
+        qty=qty,
+        uom=uom,
+        remarks=remarks,
+        created_by_id=created_by_id,
+    )
+    # no savepoint of its own: a caller's loop keeps queuing into one audit batch,
+    # and a failure here still rolls back with the caller's block
+    with transaction.atomic(using=using, savepoint=False):
+        InventoryMovement.objects.using(using).bulk_create([movement])
+
+        # the caller's instance may be stale (loaded during validation); lock the
+        # row so qty_before and the UPDATE below see the same committed quantity
+        qty_before = (
+            InventoryItem._base_manager.using(using)
+            .select_for_update()
+            .values_list("current_qty", flat=True)
+            .get(pk=item.pk)
+        )
+        item.current_qty = qty_before
+        if movement_type == Movement.IN:
+            item.adjust_qty(qty)
+        elif movement_type == Movement.OUT:
+            item.adjust_qty(-qty)
+        # TRANSFER does not change global qty (location fields are not tracked yet)
+
+        _queue_audit(using, InventoryAudit(
+            action=f"Movement {movement_type}",
+            item=item,
+            qty_before=qty_before,
+            qty_after=item.current_qty,
+        ))
+    return movement
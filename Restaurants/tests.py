@@ -1,3 +1,233 @@
-from django.test import TestCase
+from decimal import Decimal
 
-# Create your tests here.
+from django.conf import settings
+from django.db import connections, transaction
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .models import (
+    Cuisine, Customer, InventoryAudit, InventoryItem, InventoryMovement, Item, MasterCuisine, Movement,
+    Order, OrderItem, Restaurant,
+)
+from .serializers import ItemSerializer
+from .services import record_movement
+from .views import InventoryItemViewSet, ItemViewSet
+
+# Restaurants tables only migrate on tenant aliases (see MultiTenantRouter.allow_migrate),
+# so the tests run against a throwaway tenant database next to "default".
+TENANT = "tenant_test"
+if TENANT not in connections.databases:
+    connections.databases[TENANT] = {
+        **settings.DATABASES["default"],
+        "TEST": dict(settings.DATABASES["default"].get("TEST", {})),
+    }
+
+
+class Boom(Exception):
+    pass
+
+
+class RecordMovementAuditTests(TransactionTestCase):
+    # real commits: the audit batch is written by transaction.on_commit
+    databases = {"default", TENANT}
+
+    def setUp(self):
+        self.item = InventoryItem.objects.using(TENANT).create(name="Rice", sku="RICE-1")
+
+    def _move(self, qty, movement_type=Movement.IN, item=None):
+        # a freshly loaded item by default, as the serializer would pass
+        item = item or InventoryItem.objects.using(TENANT).get(pk=self.item.pk)
+        return record_movement(item=item, qty=Decimal(qty), movement_type=movement_type, using=TENANT)
+
+    def _audits(self):
+        return list(
+            InventoryAudit.objects.using(TENANT).order_by("id").values_list("qty_before", "qty_after")
+        )
+
+    def test_outside_transaction_writes_audit_immediately(self):
+        self._move(5)
+        self.assertEqual(self._audits(), [(Decimal("0"), Decimal("5"))])
+
+    def test_commit_writes_audits_in_one_insert(self):
+        audit_table = InventoryAudit._meta.db_table
+        with CaptureQueriesContext(connections[TENANT]) as ctx:
+            with transaction.atomic(using=TENANT):
+                self._move(5)
+                self._move(3)
+                self._move(2, Movement.OUT)
+                self.assertEqual(self._audits(), [])
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith(f'INSERT INTO "{audit_table}"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(self._audits(), [
+            (Decimal("0"), Decimal("5")),
+            (Decimal("5"), Decimal("8")),
+            (Decimal("8"), Decimal("6")),
+        ])
+
+    def test_savepoint_rollback_drops_its_audits(self):
+        with transaction.atomic(using=TENANT):
+            self._move(11)
+            try:
+                with transaction.atomic(using=TENANT):
+                    self._move(5)
+                    raise Boom
+            except Boom:
+                pass
+            self._move(1)
+
+        self.assertEqual(InventoryMovement.objects.using(TENANT).count(), 2)
+        self.item.refresh_from_db(using=TENANT)
+        self.assertEqual(self.item.current_qty, Decimal("12"))
+        self.assertEqual(self._audits(), [
+            (Decimal("0"), Decimal("11")),
+            (Decimal("11"), Decimal("12")),
+        ])
+
+    def test_reused_atomic_decorator_after_rollback(self):
+        # @transaction.atomic keeps one Atomic instance across calls
+        @transaction.atomic(using=TENANT)
+        def receive(qty, fail=False):
+            self._move(qty)
+            if fail:
+                raise Boom
+
+        with self.assertRaises(Boom):
+            receive(4, fail=True)
+        receive(7)
+
+        self.assertEqual(InventoryMovement.objects.using(TENANT).count(), 1)
+        self.assertEqual(self._audits(), [(Decimal("0"), Decimal("7"))])
+
+    def test_stale_instance_reads_current_qty(self):
+        # another request moves stock after this one loaded the item
+        stale = InventoryItem.objects.using(TENANT).get(pk=self.item.pk)
+        self._move(5)
+        self._move(3, item=stale)
+
+        self.assertEqual(stale.current_qty, Decimal("8"))
+        self.assertEqual(self._audits(), [
+            (Decimal("0"), Decimal("5")),
+            (Decimal("5"), Decimal("8")),
+        ])
+
+    def test_transfer_audits_current_qty(self):
+        stale = InventoryItem.objects.using(TENANT).get(pk=self.item.pk)
+        self._move(6)
+        self._move(2, Movement.TRANSFER, item=stale)
+        self.assertEqual(self._audits()[-1], (Decimal("6"), Decimal("6")))
+
+    def test_interleaved_requests_keep_audits_consistent(self):
+        # two requests loaded the item before either moved it; SQLite has no row
+        # locks, so this covers the stale read, not blocking under real concurrency
+        first = InventoryItem.objects.using(TENANT).get(pk=self.item.pk)
+        second = InventoryItem.objects.using(TENANT).get(pk=self.item.pk)
+        with transaction.atomic(using=TENANT):
+            self._move(10, item=first)
+        with transaction.atomic(using=TENANT):
+            self._move(4, Movement.OUT, item=second)
+
+        self.item.refresh_from_db(using=TENANT)
+        self.assertEqual(self.item.current_qty, Decimal("6"))
+        audits = self._audits()
+        self.assertEqual(audits, [(Decimal("0"), Decimal("10")), (Decimal("10"), Decimal("6"))])
+        # each audit's delta matches its movement
+        self.assertEqual([after - before for before, after in audits], [Decimal("10"), Decimal("-4")])
+
+    def test_adjust_qty_refreshes_needs_reorder(self):
+        item = InventoryItem.objects.using(TENANT).create(
+            name="Oil", sku="OIL-1", current_qty=Decimal("10"), reorder_point=Decimal("5"),
+        )
+        item.adjust_qty(Decimal("-8"))
+        self.assertEqual(item.current_qty, Decimal("2"))
+        self.assertTrue(item.needs_reorder)
+
+    def test_outer_rollback_discards_batch(self):
+        with self.assertRaises(Boom):
+            with transaction.atomic(using=TENANT):
+                self._move(4)
+                raise Boom
+        self._move(2)
+
+        self.assertEqual(self._audits(), [(Decimal("0"), Decimal("2"))])
+
+
+class OrderTotalsTests(TransactionTestCase):
+    databases = {"default", TENANT}
+
+    def setUp(self):
+        restaurant = Restaurant.objects.using(TENANT).create(restaurant_name="R", address="x", number="1")
+        customer = Customer.objects.using(TENANT).create(number="1", address="x", restaurant=restaurant)
+        self.order = Order.objects.using(TENANT).create(restaurant=restaurant, customer=customer)
+
+    def _line(self, price, quantity=1):
+        line = OrderItem.objects.using(TENANT).create(item_name="Tea", price=Decimal(price), quantity=quantity)
+        self.order.items.add(line)
+        return line
+
+    def test_totals_skip_soft_deleted_lines(self):
+        self._line("10")
+        deleted = self._line("5")
+        deleted.is_deleted = True
+        deleted.save(using=TENANT)
+
+        self.order.calculate_total_price()
+        self.order.refresh_from_db(using=TENANT)
+        self.assertEqual(self.order.total_price, Decimal("10.00"))
+
+    def test_totals_are_quantized_to_cents(self):
+        self._line("2.50", quantity=3)
+        total = Order.objects.using(TENANT).filter(pk=self.order.pk).totals()
+        self.assertEqual(str(total), "7.50")
+        self.assertEqual(str(Order.objects.using(TENANT).none().totals()), "0.00")
+
+
+@override_settings(ALLOWED_HOSTS=["*"])
+class ItemListTests(TransactionTestCase):
+    databases = {"default", TENANT}
+
+    def setUp(self):
+        restaurant = Restaurant.objects.using(TENANT).create(restaurant_name="R", address="x", number="1")
+        master = MasterCuisine.objects.using(TENANT).create(name="Thai")
+        cuisine = Cuisine.objects.using(TENANT).create(name="Thai", restaurant=restaurant, master_cuisine=master)
+        for name, image in (("Curry", "item_images/curry.jpg"), ("Rice", "")):
+            Item.objects.using(TENANT).create(
+                restaurant=restaurant, cuisine=cuisine, item_name=name, item_type="veg",
+                price=Decimal("5"), item_image=image,
+            )
+
+    def _get(self):
+        request = APIRequestFactory().get("/items/")
+        request.tenant_info = {"alias": TENANT}
+        return request
+
+    def test_list_matches_item_serializer(self):
+        response = ItemViewSet.as_view({"get": "list"})(self._get())
+        self.assertEqual(response.status_code, 200)
+
+        expected = ItemSerializer(
+            Item.objects.using(TENANT).order_by("item_name"), many=True,
+            context={"alias": TENANT, "request": Request(self._get())},
+        ).data
+        self.assertEqual([dict(row) for row in response.data["results"]], [dict(row) for row in expected])
+
+
+@override_settings(ALLOWED_HOSTS=["*"])
+class InventoryItemUpdateTests(TransactionTestCase):
+    databases = {"default", TENANT}
+
+    def test_patch_returns_recomputed_needs_reorder(self):
+        item = InventoryItem.objects.using(TENANT).create(
+            name="Rice", sku="RICE-1", current_qty=Decimal("10"), reorder_point=Decimal("5"),
+        )
+        self.assertFalse(item.needs_reorder)
+
+        request = APIRequestFactory().patch(f"/inventory-items/{item.pk}/", {"reorder_point": "20"}, format="json")
+        request.tenant_info = {"alias": TENANT}
+        response = InventoryItemViewSet.as_view({"patch": "partial_update"})(request, pk=item.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["needs_reorder"])
+        item.refresh_from_db(using=TENANT)
+        self.assertTrue(item.needs_reorder)
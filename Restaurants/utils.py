@@ -23,7 +23,7 @@ ACCOUNTS_URL = os.getenv("ACCOUNTS_SERVICE_URL", f"http://{LOCAL_DB_HOST}:8000")
 INTERNAL_REGISTER_DB_TOKEN = os.getenv("INTERNAL_REGISTER_DB_TOKEN", "").strip()
 ACCOUNTS_TIMEOUT = int(os.getenv("ACCOUNTS_HTTP_TIMEOUT", "10"))
 DB_ENCRYPTION_KEY = os.getenv("DB_ENCRYPTION_KEY", "").strip()
-TENANT_CONN_MAX_AGE = int(os.getenv("TENANT_CONN_MAX_AGE", "60"))
+TENANT_CONN_MAX_AGE = int(os.getenv("TENANT_CONN_MAX_AGE", "600"))
 TENANT_CONN_TIMEOUT = int(os.getenv("TENANT_CONN_TIMEOUT", "5"))
 
 
@@ -347,6 +347,8 @@ def register_tenant_database(tenant_id, db_config):
             'PASSWORD': db_config.get('PASSWORD'),
             'HOST': db_config.get('HOST'),
             'PORT': db_config.get('PORT', 5432),
+            'CONN_MAX_AGE': TENANT_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
         }
         
         # Test connection
@@ -1,8 +1,6 @@
 from __future__ import annotations
 import json
 import logging
-from django.db.models import Q, Count, Sum, Min, F  # Add F here
-
 from django.db.models import Prefetch
 import os
 import traceback
@@ -11,8 +9,9 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.core.management import call_command
-from django.db import connections, transaction, IntegrityError, models  # Add models here
-from django.db.models import Q, Count, Sum
+from django.db import connections, transaction, DatabaseError, IntegrityError, models  # Add models here
+from django.db.models import Q, Count
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from django.core.exceptions import ValidationError as DjangoValidationError
 
@@ -24,7 +23,8 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.exceptions import ValidationError as DRFValidationError
-from .pagination import StandardResultsSetPagination
+from rest_framework.utils.encoders import JSONEncoder
+from .pagination import OrderCursorPagination, StandardResultsSetPagination
 from rest_framework.parsers import MultiPartParser, FormParser
 
 from FB.db_router import set_current_tenant, get_current_tenant
@@ -72,12 +72,38 @@ def _ensure_alias_ready(tenant: dict) -> str:
             raise exceptions.APIException("Unable to resolve tenant DB.")
     return alias
 
+def _request_alias(request) -> str:
+    # resolved once per request; the mixins below ask for it several times
+    alias = getattr(request, "_tenant_alias", None)
+    if alias is None:
+        alias = _ensure_alias_ready(_get_tenant_from_request(request))
+        request._tenant_alias = alias
+    return alias
+
+def _json_array_stream(rows):
+    """Stream an iterable of dicts as one JSON array (for export endpoints)."""
+    def chunks():
+        yield "["
+        for i, row in enumerate(rows):
+            yield ("," if i else "") + json.dumps(row, cls=JSONEncoder)
+        yield "]"
+    return StreamingHttpResponse(chunks(), content_type="application/json")
+
+def _warm_connection(alias: str) -> None:
+    # open the persistent (CONN_MAX_AGE) tenant connection as soon as the alias is
+    # known, so the view's first query doesn't pay the connect handshake
+    try:
+        connections[alias].ensure_connection()
+    except Exception:
+        logger.warning("Could not open connection for tenant '%s'", alias, exc_info=True)
+
 class RouterTenantContextMixin(APIView):
     """
     Ensure DB router knows the tenant BEFORE any serializer/query runs.
     """
     def initial(self, request, *args, **kwargs):
-        alias = _ensure_alias_ready(_get_tenant_from_request(request))
+        alias = _request_alias(request)
+        _warm_connection(alias)
         set_current_tenant(alias)
         return super().initial(request, *args, **kwargs)
 
@@ -90,14 +116,14 @@ class RouterTenantContextMixin(APIView):
 class TenantSerializerContextMixin:
     def get_serializer_context(self):
         ctx = super().get_serializer_context()
-        alias = _ensure_alias_ready(_get_tenant_from_request(self.request))
+        alias = _request_alias(self.request)
         ctx["alias"] = alias
         ctx["request"] = self.request
         return ctx
 
 class _TenantDBMixin:
     def _alias(self) -> str:
-        return _ensure_alias_ready(_get_tenant_from_request(self.request))
+        return _request_alias(self.request)
 
 # -------------------------------------------------------------------
 # Register/Prepare DB for a client
@@ -187,61 +213,64 @@ class RestaurantViewSet(RouterTenantContextMixin, TenantSerializerContextMixin,
 
     def get_queryset(self):
         alias = self._alias()
-        return Restaurant.objects.using(alias).all()
+        # serializers render the TEXT columns the default manager defers
+        qs = Restaurant.objects.using(alias).defer(None)
+        if self.action in ('list', 'export'):
+            qs = RestaurantListSerializer.setup_eager_loading(qs)
+        return qs
 
     def get_serializer_class(self):
         if self.action == 'list':
             return RestaurantListSerializer
         return RestaurantSerializer
 
+    def list(self, request, *args, **kwargs):
+        # read-only projection, same as ItemViewSet.list; RestaurantListSerializer
+        # stays the schema for this response
+        qs = RestaurantListSerializer.values_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(qs)
+        if page is not None:
+            return self.get_paginated_response(RestaurantListSerializer.rows_from_values(page))
+        return Response(RestaurantListSerializer.rows_from_values(qs))
+
+    # the serializer writes to its context alias; extra save() kwargs become model fields
     def perform_create(self, serializer):
-        alias = self._alias()
-        serializer.save(
-            created_by_id=self.request.user.id if self.request.user.is_authenticated else None,
-            using=alias
-    )
+        serializer.save(created_by_id=self.request.user.id if self.request.user.is_authenticated else None)
 
     def perform_update(self, serializer):
-        alias = self._alias()
-        serializer.save(
-            updated_by_id=self.request.user.id if self.request.user.is_authenticated else None,
-            using=alias
-    )
+        serializer.save(updated_by_id=self.request.user.id if self.request.user.is_authenticated else None)
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = Restaurant(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Unpaginated restaurant list, streamed"""
+        qs = self.filter_queryset(self.get_queryset())
+        return _json_array_stream(RestaurantListSerializer.stream(qs))
 
     @action(detail=False, methods=['get'])
     def active(self, request):
         """Get restaurants (no active field exists now)"""
         alias = self._alias()
-        restaurants = Restaurant.objects.using(alias).all()
-        serializer = self.get_serializer(restaurants, many=True)
-        return Response(serializer.data)
+        restaurants = Restaurant.objects.using(alias)
+        return Response(self.get_serializer().values_rows(restaurants))
 
     @action(detail=False, methods=['get'])
     def dashboard_stats(self, request):
         alias = self._alias()
         try:
             total_restaurants = Restaurant.objects.using(alias).count()
-            total_orders = Order.objects.using(alias).count()
-            pending_orders = Order.objects.using(alias).filter(Paid=False).count()
+            # both order counts in one scan
+            order_counts = Order.objects.using(alias).aggregate(
+                total=Count('id'),
+                pending=Count('id', filter=Q(Paid=False)),
+            )
 
             return Response({
                 'total_restaurants': total_restaurants,
-                'total_orders': total_orders,
-                'pending_orders': pending_orders,
+                'total_orders': order_counts['total'],
+                'pending_orders': order_counts['pending'],
                 'generated_at': timezone.now().isoformat(),
             })
-        except Exception:
+        except DatabaseError:
             logger.exception("dashboard_stats failed")
             return Response(
                 {'error': 'Failed to fetch dashboard statistics'},
@@ -269,38 +298,28 @@ class RestaurantScheduleViewSet(RouterTenantContextMixin, TenantSerializerContex
             .all()
         )
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        with transaction.atomic(using=alias):
-            obj = RestaurantSchedule(**serializer.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-
-        serializer.instance = obj
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
-
     @action(detail=False, methods=["get"], url_path="by-restaurant/(?P<restaurant_id>[^/.]+)")
     def by_restaurant(self, request, restaurant_id=None):
         """Get full 7-day schedule of a restaurant (ensures missing days are created)."""
         alias = self._alias()
 
-        # Ensure all 7 days exist
-        for day in range(1, 8):
-            RestaurantSchedule.objects.using(alias).get_or_create(
-                restaurant_id=restaurant_id,
-                day=day,
-                defaults={"operational": False},
-            )
-
-        schedules = (
-            RestaurantSchedule.objects.using(alias)
+        # soft-deleted days are read too: they still hold their (restaurant, day) row
+        rows = (
+            RestaurantSchedule.all_objects.using(alias)
             .filter(restaurant_id=restaurant_id)
             .order_by("day")
         )
 
+        # Ensure all 7 days exist: one INSERT for whatever is missing, usually nothing
+        missing = set(RestaurantSchedule.Day.values).difference(s.day for s in rows)
+        if missing:
+            RestaurantSchedule.objects.using(alias).bulk_create(
+                [RestaurantSchedule(restaurant_id=restaurant_id, day=day, operational=False) for day in sorted(missing)],
+                ignore_conflicts=True,
+            )
+            rows = rows.all()
+        schedules = [s for s in rows if not s.is_deleted]
+
         serializer = self.get_serializer(schedules, many=True)
         return Response(serializer.data)
 
@@ -320,7 +339,7 @@ class RestaurantScheduleBulkView(
         output = [
             {
                 "day": obj.day,
-                "day_display": obj.get_day_display(),
+                "day_display": RestaurantSchedule.DAY_LABELS.get(obj.day, obj.day),
                 "operational": obj.operational,
                 "start_time": obj.start_time,
                 "end_time": obj.end_time,
@@ -334,16 +353,20 @@ class RestaurantScheduleBulkView(
         ]
         return Response(output, status=status.HTTP_201_CREATED)
 
-class RestaurantWeeklyScheduleView(APIView):
+class RestaurantWeeklyScheduleView(RouterTenantContextMixin, _TenantDBMixin, APIView):
     """
     Returns 7 rows (Mon-Sun) for a restaurant's schedule.
     If some days are missing, they will be filled with defaults (blank).
     """
     pagination_class = StandardResultsSetPagination
     def get(self, request, restaurant_id):
-        # Pehle se existing schedules fetch karo
-        schedules = RestaurantSchedule.objects.filter(restaurant_id=restaurant_id)
-        schedule_map = {s.day: s for s in schedules}  # map day → schedule
+        alias = self._alias()
+        # Pehle se existing schedules fetch karo -- one query, one serializer pass
+        schedules = RestaurantSchedule.objects.using(alias).filter(restaurant_id=restaurant_id)
+        rows = RestaurantScheduleSerializer(
+            schedules, many=True, context={"alias": alias, "request": request}
+        ).data
+        schedule_map = {row["day"]: row for row in rows}  # map day → schedule
 
         # Default response structure (1-7 = Mon-Sun)
         days = range(1, 8)
@@ -351,7 +374,7 @@ class RestaurantWeeklyScheduleView(APIView):
 
         for day in days:
             if day in schedule_map:
-                serialized = RestaurantScheduleSerializer(schedule_map[day]).data
+                serialized = schedule_map[day]
             else:
                 
                 serialized = {
@@ -382,16 +405,6 @@ class BlockedDayViewSet(RouterTenantContextMixin, TenantSerializerContextMixin,
         alias = self._alias()
         return Blocked_Day.objects.using(alias).select_related('restaurant').all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = Blocked_Day(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
 
 class TableBookingViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = TableBookingSerializer
@@ -406,17 +419,6 @@ class TableBookingViewSet(RouterTenantContextMixin, TenantSerializerContextMixin
         alias = self._alias()
         return TableBooking.objects.using(alias).select_related('restaurant').all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = TableBooking(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
-
     @action(detail=False, methods=['get'])
     def today_bookings(self, request):
         """Get today's bookings"""
@@ -424,8 +426,7 @@ class TableBookingViewSet(RouterTenantContextMixin, TenantSerializerContextMixin
         today = timezone.now().date()
         # Update this to use the correct date field from your model
         bookings = TableBooking.objects.using(alias).all()  # Remove date filter for now
-        serializer = self.get_serializer(bookings, many=True)
-        return Response(serializer.data)
+        return Response(self.get_serializer().values_rows(bookings))
 
 class OrderConfigureViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = OrderConfigureSerializer
@@ -440,16 +441,6 @@ class OrderConfigureViewSet(RouterTenantContextMixin, TenantSerializerContextMix
         alias = self._alias()
         return OrderConfigure.objects.using(alias).select_related('restaurant').all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = OrderConfigure(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
 
 # -------------------------------------------------------------------
 # Menu Management ViewSets
@@ -486,50 +477,6 @@ class MasterItemViewSet(RouterTenantContextMixin, TenantSerializerContextMixin,
         return MasterItem.objects.using(alias).select_related("master_cuisine").all()
 
 
-class CuisineViewSet(
-    RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet
-):
-    serializer_class = CuisineSerializer
-    pagination_class = StandardResultsSetPagination
-    permission_classes = [permissions.AllowAny]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ["name"]
-    ordering_fields = ["name", "id"]
-    ordering = ["name"]
-    queryset = Cuisine.objects.none()
-
-    def get_queryset(self):
-        alias = self._alias()
-        return Cuisine.objects.using(alias).select_related("restaurant", "master_cuisine").all()
-
-    def perform_create(self, serializer):
-        alias = self._alias()
-
-        # pehle cuisine ko tenant DB me save karna
-        cuisine = serializer.save(using=alias)
-
-        # ab master items uthao
-        master_items = MasterItem.objects.using(alias).filter(
-            master_cuisine=cuisine.master_cuisine
-        )
-
-        # bulk create items
-        items_to_create = [
-            Item(
-                restaurant=cuisine.restaurant,
-                cuisine=cuisine,
-                master_item=m_item,
-                item_name=m_item.name,
-                price=0,        # default price
-                master_price=0, # default master price
-                item_type=m_item.item_type
-            )
-            for m_item in master_items
-        ]
-        if items_to_create:
-            Item.objects.using(alias).bulk_create(items_to_create)
-
-
 class CategoryViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = CategorySerializer
     pagination_class = StandardResultsSetPagination
@@ -543,7 +490,10 @@ class CategoryViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _T
 
     def get_queryset(self):
         alias = self._alias()
-        return Category.objects.using(alias).select_related( "restaurant", "parent").all()
+        # restaurant/parent render as pks; the cuisines m2m is batched into one IN query
+        return Category.objects.using(alias).prefetch_related(
+            Prefetch("cuisines", queryset=Cuisine.objects.using(alias).only("id"))
+        )
 
 
 class ItemViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
@@ -559,23 +509,38 @@ class ItemViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _Tenan
 
     def get_queryset(self):
         alias = self._alias()
-        qs = Item.objects.using(alias).select_related(
-            "restaurant", "cuisine", "master_item", "category"
-        ).all()
+        qs = Item.objects.using(alias)
+        # ItemSerializer renders FKs as ids; only the export's ItemListSerializer
+        # needs the related names joined in
+        if self.action == "export":
+            qs = ItemListSerializer.setup_eager_loading(qs)
 
         # Filter by restaurant and pure_veg logic
         restaurant_id = self.request.query_params.get("restaurant")
         if restaurant_id:
-            try:
-                restaurant = Restaurant.objects.using(alias).get(pk=restaurant_id)
-                if restaurant.pure_veg:
-                    qs = qs.filter(restaurant_id=restaurant_id, master_item__is_veg=True)
-                else:
-                    qs = qs.filter(restaurant_id=restaurant_id)
-            except Restaurant.DoesNotExist:
-                qs = qs.none()
+            # folded into the item query (no separate restaurant lookup): a missing or
+            # soft-deleted restaurant yields no rows, a pure-veg one only veg items
+            qs = qs.filter(restaurant_id=restaurant_id, restaurant__is_deleted=False).filter(
+                Q(restaurant__pure_veg=False) | Q(item_type__iexact="veg")
+            )
         return qs
 
+    def list(self, request, *args, **kwargs):
+        # read-only projection of ItemSerializer's columns: skip model instances,
+        # same payload as the serializer path
+        serializer = self.get_serializer()
+        qs = serializer.values_queryset(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(qs)
+        if page is not None:
+            return self.get_paginated_response(serializer.rows_from_values(page))
+        return Response(serializer.rows_from_values(qs))
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Unpaginated item list, streamed"""
+        qs = self.filter_queryset(self.get_queryset())
+        return _json_array_stream(ItemListSerializer.stream(qs))
+
     @action(detail=False, methods=["get"])
     def by_cuisine(self, request):
         alias = self._alias()
@@ -615,16 +580,6 @@ class CustomerViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _T
         alias = self._alias()
         return Customer.objects.using(alias).all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = Customer(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
 
 # -------------------------------------------------------------------
 # Order Management ViewSets
@@ -655,34 +610,27 @@ class OrderItemViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _
 
 class OrderViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = OrderSerializer
-    pagination_class = StandardResultsSetPagination
+    pagination_class = OrderCursorPagination
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['restaurant', 'Paid', 'order_type']
     search_fields = ['customer__customer_name', 'customer__number']
-    ordering_fields = ['order_time', 'total_price', 'subtotal']
-    ordering = ['-order_time']
+    # the cursor paginator takes its ordering from OrderingFilter, and it needs a
+    # mostly-unique first column, so only order_time is client-selectable
+    ordering_fields = ['order_time']
+    ordering = ['-order_time', '-id']
     
     queryset = Order.objects.none()
 
     def get_queryset(self):
         alias = self._alias()
-        return Order.objects.using(alias).select_related('restaurant').all()
-
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = s.save()
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
+        return OrderSerializer.optimize(Order.objects.using(alias))
 
     @action(detail=False, methods=['get'])
     def pending_orders(self, request):
         """Get pending orders"""
         alias = self._alias()
-        orders = Order.objects.using(alias).filter(Paid=False)
+        orders = OrderSerializer.optimize(Order.objects.using(alias).filter(Paid=False))
         serializer = self.get_serializer(orders, many=True)
         return Response(serializer.data)
 
@@ -691,7 +639,7 @@ class OrderViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _Tena
         """Get today's orders"""
         alias = self._alias()
         today = timezone.now().date()
-        orders = Order.objects.using(alias).filter(order_time__date=today)
+        orders = OrderSerializer.optimize(Order.objects.using(alias).filter(order_time__date=today))
         serializer = self.get_serializer(orders, many=True)
         return Response(serializer.data)
 
@@ -714,16 +662,6 @@ class SupplierViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _T
         alias = self._alias()
         return Supplier.objects.using(alias).all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = Supplier(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
 
 class WarehouseViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = WarehouseSerializer
@@ -741,51 +679,29 @@ class WarehouseViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _
         alias = self._alias()
         return Warehouse.objects.using(alias).select_related('restaurant').all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = Warehouse(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
 
 class InventoryItemViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = InventoryItemSerializer
     pagination_class = StandardResultsSetPagination
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['category', 'preferred_supplier']
-    search_fields = ['item_name', 'sku']
-    ordering_fields = ['item_name', 'current_stock', 'last_updated']
-    ordering = ['item_name']
+    filterset_fields = ['preferred_supplier']
+    search_fields = ['name', 'sku']
+    ordering_fields = ['name', 'current_qty', 'last_updated']
+    ordering = ['name']
     
     queryset = InventoryItem.objects.none()
 
     def get_queryset(self):
         alias = self._alias()
-        return InventoryItem.objects.using(alias).select_related('category', 'preferred_supplier').all()
-
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = InventoryItem(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
+        # the serializer renders preferred_supplier as a pk, so no join is needed
+        return InventoryItem.objects.using(alias).defer(None)
 
     @action(detail=False, methods=['get'])
     def low_stock(self, request):
         """Get items with low stock"""
         alias = self._alias()
-        items = InventoryItem.objects.using(alias).filter(
-            current_stock__lte=F('min_stock_level')  # Fixed: now uses F
-        )
+        items = InventoryItem.objects.using(alias).defer(None).filter(needs_reorder=True)
         serializer = self.get_serializer(items, many=True)
         return Response(serializer.data)
 
@@ -794,25 +710,22 @@ class InventoryMovementViewSet(RouterTenantContextMixin, TenantSerializerContext
     pagination_class = StandardResultsSetPagination
     permission_classes = [permissions.AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['item', 'movement_type', 'from_location', 'to_location']
-    search_fields = ['item__item_name', 'reference_number']
-    ordering_fields = ['timestamp', 'quantity']
-    ordering = ['-timestamp']
+    filterset_fields = ['item', 'movement_type']
+    search_fields = ['item__name', 'item__sku', 'remarks']
+    ordering_fields = ['created_at', 'qty']
+    ordering = ['-created_at']
     
     queryset = InventoryMovement.objects.none()
 
     def get_queryset(self):
         alias = self._alias()
-        return InventoryMovement.objects.using(alias).select_related('item', 'from_location', 'to_location').all()
+        return InventoryMovement.objects.using(alias).select_related('item').all()
 
     def create(self, request, *args, **kwargs):
-        alias = self._alias()
         s = self.get_serializer(data=request.data)
         s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = InventoryMovement(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
+        # record_movement opens its own transaction on the tenant alias
+        obj = s.save(created_by_id=self.request.user.id if self.request.user.is_authenticated else None)
         s.instance = obj
         return Response(s.data, status=status.HTTP_201_CREATED)
 
@@ -835,16 +748,6 @@ class IngredientViewSet(RouterTenantContextMixin, TenantSerializerContextMixin,
         alias = self._alias()
         return Ingredient.objects.using(alias).all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = Ingredient(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
 
 class QtyIngredientViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = QtyIngredientSerializer
@@ -859,23 +762,11 @@ class QtyIngredientViewSet(RouterTenantContextMixin, TenantSerializerContextMixi
         alias = self._alias()
         return QtyIngredient.objects.using(alias).select_related('item', 'ingredient').all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = QtyIngredient(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
 
 # -------------------------------------------------------------------
 # Media Management ViewSets
 # -------------------------------------------------------------------
 
-
-
 class RestoCoverImageViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = RestoCoverImageSerializer
     pagination_class = StandardResultsSetPagination
@@ -1044,33 +935,30 @@ class CuisineViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _Te
 
     def get_queryset(self):
         alias = self._alias()
-        return Cuisine.objects.using(alias).select_related("restaurant", "master_cuisine").all()
+        # CuisineSerializer renders restaurant/master_cuisine as pks and nests no items,
+        # so the joins only widened every row
+        return Cuisine.objects.using(alias).all()
 
     def perform_create(self, serializer):
-        alias = self._alias()
-        cuisine = serializer.save()
-        master_items = MasterItem.objects.using(alias).filter(master_cuisine=cuisine.master_cuisine)
-        items_to_create = [
-            Item(
-                restaurant=cuisine.restaurant,
-                cuisine=cuisine,
-                master_item=m_item,
-                item_name=m_item.name,
-                price=0,
-            )
-            for m_item in master_items
-        ]
-        if items_to_create:
-            Item.objects.using(alias).bulk_create(items_to_create)
+        # the post_save signal seeds the Items from MasterItems; keep both in one transaction
+        with transaction.atomic(using=self._alias()):
+            serializer.save()
 
     # 🔹 Custom nested API
     @action(detail=False, methods=["get"])
     def with_categories_items(self, request):
         alias = self._alias()
-        cuisines = Cuisine.objects.using(alias).prefetch_related(
-            Prefetch("categories", queryset=Category.objects.using(alias).prefetch_related("items"))
+        # one query per level; only() keeps the rendered columns (no image paths, TEXT or audit fields)
+        items = Item.objects.using(alias).only(
+            "id", "item_name", "price", "description", "item_type", "category_id"
+        )
+        categories = Category.objects.using(alias).only("id", "name", "timing").prefetch_related(
+            Prefetch("items", queryset=items)
+        )
+        cuisines = Cuisine.objects.using(alias).only("id", "name").prefetch_related(
+            Prefetch("categories", queryset=categories)
         )
-        serializer = CuisineNestedSerializer(cuisines, many=True)
+        serializer = CuisineNestedSerializer(cuisines, many=True, context=self.get_serializer_context())
         return Response(serializer.data)
 
 # ============= Table Booking ViewSets =============
@@ -1090,18 +978,6 @@ class TableBookingFloorViewSet(RouterTenantContextMixin, TenantSerializerContext
         alias = self._alias()
         return tablebookingfloor.objects.using(alias).all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = tablebookingfloor(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
-
-
 class TableViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = TableSerializer
     permission_classes = [permissions.AllowAny]
@@ -1136,16 +1012,6 @@ class TableBookingLogViewSet(RouterTenantContextMixin, TenantSerializerContextMi
         alias = self._alias()
         return TableBookingLog.objects.using(alias).all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = TableBookingLog(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
 
 
 # ============= KOT & Billing ViewSets =============
@@ -1165,18 +1031,6 @@ class KOTViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _Tenant
         alias = self._alias()
         return KOT.objects.using(alias).all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = KOT(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)
-
-
 class BillingViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _TenantDBMixin, viewsets.ModelViewSet):
     serializer_class = BillingSerializer
     pagination_class = StandardResultsSetPagination
@@ -1192,13 +1046,3 @@ class BillingViewSet(RouterTenantContextMixin, TenantSerializerContextMixin, _Te
         alias = self._alias()
         return Billing.objects.using(alias).all()
 
-    def create(self, request, *args, **kwargs):
-        alias = self._alias()
-        s = self.get_serializer(data=request.data)
-        s.is_valid(raise_exception=True)
-        with transaction.atomic(using=alias):
-            obj = Billing(**s.validated_data)
-            obj.full_clean(validate_unique=False)
-            obj.save(using=alias)
-        s.instance = obj
-        return Response(s.data, status=status.HTTP_201_CREATED)